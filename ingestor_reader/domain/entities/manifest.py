@@ -16,6 +16,7 @@ class OutputsInfo(BaseModel):
     files: list[str]
     rows_total: int
     rows_added_this_version: int
+    max_date: str | None = None
 
 
 class IndexInfo(BaseModel):
@@ -1,43 +1,67 @@
 """Consolidation service for projections."""
+from typing import Optional
+
 import pandas as pd
 
 from ingestor_reader.infra.s3_catalog import S3Catalog
-from ingestor_reader.infra.common import get_logger
+from ingestor_reader.infra.common import get_logger, prefetch_map
 
 logger = get_logger(__name__)
 
+EVENT_READ_WORKERS = 16
+
+
+def _read_event(catalog: S3Catalog, event_key: str) -> Optional[pd.DataFrame]:
+    """
+    Read a single event DataFrame.
+    
+    Args:
+        catalog: S3 catalog instance
+        event_key: Event key to read
+        
+    Returns:
+        Event DataFrame, or None if it cannot be read or has no series column
+    """
+    try:
+        body = catalog.s3.get_object(event_key)
+        df = catalog.parquet_io.read_from_bytes(body)
+    except Exception as e:
+        logger.warning("Failed to read event %s: %s", event_key, e)
+        return None
+    
+    if "internal_series_code" not in df.columns:
+        logger.warning("No internal_series_code column in event %s", event_key)
+        return None
+    
+    logger.debug("Read event %s: %d rows", event_key, len(df))
+    return df
+
 
 def _read_events_for_month(
     catalog: S3Catalog,
     event_keys: list[str],
+    max_workers: int = EVENT_READ_WORKERS,
 ) -> list[pd.DataFrame]:
     """
     Read all event DataFrames for a month.
     
+    Events are fetched concurrently (GETs are latency-bound) and returned
+    in the order of event_keys.
+    
     Args:
         catalog: S3 catalog instance
         event_keys: List of event keys to read
+        max_workers: Maximum concurrent event reads
         
     Returns:
         List of DataFrames (one per event)
     """
-    all_events = []
-    for event_key in event_keys:
-        try:
-            body = catalog.s3.get_object(event_key)
-            df = catalog.parquet_io.read_from_bytes(body)
-            
-            if "internal_series_code" not in df.columns:
-                logger.warning("No internal_series_code column in event %s", event_key)
-                continue
-            
-            all_events.append(df)
-            logger.debug("Read event %s: %d rows", event_key, len(df))
-        except Exception as e:
-            logger.warning("Failed to read event %s: %s", event_key, e)
-            continue
-    
-    return all_events
+    events = prefetch_map(
+        lambda event_key: _read_event(catalog, event_key),
+        event_keys,
+        max_workers=max_workers,
+    )
+    return [df for df in events if df is not None]
 
 
 def _deduplicate_dataframe(
@@ -68,6 +92,7 @@ def consolidate_month_projections(
     year: int,
     month: int,
     primary_keys: list[str],
+    max_workers: int = EVENT_READ_WORKERS,
 ) -> dict[str, pd.DataFrame]:
     """
     Consolidate all events for a month and group by series.
@@ -81,6 +106,7 @@ def consolidate_month_projections(
         year: Year
         month: Month (1-12)
         primary_keys: Primary key columns for deduplication
+        max_workers: Maximum concurrent event reads
         
     Returns:
         Dict mapping series_code to consolidated DataFrame
@@ -99,7 +125,7 @@ def consolidate_month_projections(
                 len(event_keys), year, month)
     
 
-    all_events = _read_events_for_month(catalog, event_keys)
+    all_events = _read_events_for_month(catalog, event_keys, max_workers=max_workers)
     
     if not all_events:
         logger.warning("No valid events found for %d-%02d", year, month)
@@ -114,7 +140,7 @@ def consolidate_month_projections(
                 all_data["internal_series_code"].nunique())
     
     series_projections = {}
-    for series_code, series_data in all_data.groupby("internal_series_code"):
+    for series_code, series_data in all_data.groupby("internal_series_code", sort=False):
 
         consolidated = _deduplicate_dataframe(series_data, primary_keys)
         series_projections[series_code] = consolidated
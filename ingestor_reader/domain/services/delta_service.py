@@ -1,5 +1,6 @@
 """Delta computation service."""
 import hashlib
+import numpy as np
 import pandas as pd
 
 
@@ -10,6 +11,43 @@ def compute_key_hash(row: pd.Series, key_columns: list[str]) -> str:
     return hashlib.sha1(key_string.encode()).hexdigest()
 
 
+def _row_dtype(df: pd.DataFrame) -> np.dtype | None:
+    """
+    Get the dtype of the rows that df.apply(axis=1) yields.
+    
+    Rows of an all-numeric frame are upcast to the common numeric dtype (an
+    int next to a float column becomes 1.0); any other mix of dtypes gives
+    object rows that keep each value's own type.
+    
+    Returns:
+        Common numeric dtype, or None if values keep their column's type
+    """
+    dtypes = list(df.dtypes)
+    if dtypes and all(isinstance(dtype, np.dtype) and dtype.kind in "iuf" for dtype in dtypes):
+        return np.result_type(*dtypes)
+    return None
+
+
+def compute_key_hashes(df: pd.DataFrame, key_columns: list[str]) -> pd.Series:
+    """
+    Compute SHA1 hashes of primary key values for all rows.
+    
+    Produces the same digests as compute_key_hash applied row by row (including
+    the upcast of numeric keys in all-numeric frames), but builds the key
+    strings column by column instead of materializing a Series per row.
+    """
+    row_dtype = _row_dtype(df)
+    columns = [
+        map(str, (df[col] if row_dtype is None else df[col].astype(row_dtype)).tolist())
+        for col in key_columns
+    ]
+    hashes = [
+        hashlib.sha1("|".join(values).encode()).hexdigest()
+        for values in zip(*columns)
+    ]
+    return pd.Series(hashes, index=df.index, dtype=object)
+
+
 def compute_delta(
     normalized_df: pd.DataFrame,
     index_df: pd.DataFrame | None,
@@ -29,18 +67,21 @@ def compute_delta(
         DataFrame with only new rows
     """
 
-    normalized_df = normalized_df.copy()
-    normalized_df[hash_column] = normalized_df.apply(
-        lambda row: compute_key_hash(row, primary_keys), axis=1
-    )
+    normalized_df = normalized_df.copy(deep=False)
+    normalized_df[hash_column] = compute_key_hashes(normalized_df, primary_keys)
     
 
     if index_df is None or len(index_df) == 0:
         return normalized_df
     
 
-    existing_hashes = set(index_df[hash_column].values)
-    added_df = normalized_df[~normalized_df[hash_column].isin(existing_hashes)].copy()
+    # The index already stores key_hash, so only the new rows are hashed. The
+    # lookup table is built from the (small) batch and the index is scanned
+    # against it, rather than hashing the whole index on every run
+    new_hashes = normalized_df[hash_column]
+    index_hashes = index_df[hash_column]
+    existing_hashes = index_hashes[index_hashes.isin(new_hashes)]
+    added_df = normalized_df[~new_hashes.isin(existing_hashes)]
     
     return added_df
 
@@ -62,10 +103,11 @@ def update_index(
         Updated index DataFrame
     """
     if current_index_df is None or len(current_index_df) == 0:
-        return added_df[[hash_column]].copy()
+        # Nothing to merge with; column selection is already a (lazy) copy
+        return added_df[[hash_column]]
     
 
-    new_hashes = added_df[[hash_column]].copy()
+    new_hashes = added_df[[hash_column]]
     updated_index = pd.concat([current_index_df, new_hashes], ignore_index=True)
     return updated_index.drop_duplicates(subset=[hash_column], keep="first")
 
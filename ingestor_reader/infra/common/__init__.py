@@ -9,8 +9,19 @@ from ingestor_reader.infra.common.errors import (
     StorageError,
 )
 from ingestor_reader.infra.common.series import resolve_series_code, get_series_code_column
-from ingestor_reader.infra.common.dataframe_utils import find_date_column, add_year_month_partitions
-from ingestor_reader.infra.common.hash_utils import compute_file_hash, compute_string_hash
+from ingestor_reader.infra.common.dataframe_utils import (
+    find_date_column,
+    as_datetime,
+    parse_dates,
+    add_year_month_partitions,
+    year_month_partition_indices,
+)
+from ingestor_reader.infra.common.hash_utils import (
+    compute_file_hash,
+    compute_string_hash,
+    new_file_hasher,
+)
+from ingestor_reader.infra.common.concurrency import prefetch_map, run_concurrently
 
 __all__ = [
     "load_app_config",
@@ -28,8 +39,14 @@ __all__ = [
     "resolve_series_code",
     "get_series_code_column",
     "find_date_column",
+    "as_datetime",
+    "parse_dates",
     "add_year_month_partitions",
+    "year_month_partition_indices",
     "compute_file_hash",
     "compute_string_hash",
+    "new_file_hasher",
+    "prefetch_map",
+    "run_concurrently",
 ]
 
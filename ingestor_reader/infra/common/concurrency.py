@@ -0,0 +1,70 @@
+"""Concurrency helpers for overlapping I/O with processing."""
+from collections import deque
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def prefetch_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 4,
+    max_pending: Optional[int] = None,
+) -> Iterator[R]:
+    """
+    Apply func to items in a thread pool, yielding results in input order.
+    
+    At most max_pending calls are in flight, so the caller can process
+    result N while results N+1.. are still being fetched, without buffering
+    the whole input in memory.
+    
+    Args:
+        func: Function to apply (typically an I/O call)
+        items: Items to process
+        max_workers: Number of worker threads
+        max_pending: Maximum in-flight calls (defaults to 2 * max_workers)
+        
+    Yields:
+        Results of func, in the same order as items
+    """
+    max_pending = max_pending or 2 * max_workers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future] = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_concurrently(
+    func: Callable[[T], object],
+    items: Iterable[T],
+    max_workers: int = 16,
+) -> None:
+    """
+    Call func for every item in a thread pool, failing fast.
+    
+    Returns once all calls have finished. If any call raises, calls that
+    have not started yet are cancelled and the first exception is re-raised.
+    
+    Args:
+        func: Function to apply (typically an I/O call)
+        items: Items to process
+        max_workers: Maximum number of worker threads
+    """
+    items = list(items)
+    if not items:
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(len(items), max_workers)) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+        for future in futures:
+            if future.done() and not future.cancelled() and future.exception() is not None:
+                raise future.exception()
@@ -1,8 +1,63 @@
 """Common DataFrame utilities."""
 from typing import Optional
+import numpy as np
 import pandas as pd
 
 
+# Expected date string format per dataset frequency, tried before inference
+FREQUENCY_DATE_FORMATS = {
+    "H": "%Y-%m-%d %H:%M:%S",
+    "D": "%Y-%m-%d",
+    "M": "%Y-%m",
+    "A": "%Y",
+    "Y": "%Y",
+}
+
+
+def as_datetime(values: pd.Series, errors: str = "coerce") -> pd.Series:
+    """
+    Convert a column to datetime, skipping the parse if it already is one.
+    
+    Args:
+        values: Column to convert
+        errors: pd.to_datetime error handling ("coerce" turns invalid dates
+            into NaT, "raise" raises)
+        
+    Returns:
+        Datetime Series (the input itself if it is already datetime64)
+    """
+    dtype = values.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype) or (isinstance(dtype, np.dtype) and dtype.kind == "M"):
+        return values
+    return pd.to_datetime(values, errors=errors)
+
+
+def parse_dates(values: pd.Series, frequency: Optional[str] = None) -> pd.Series:
+    """
+    Parse a date column, using the format implied by the dataset frequency.
+    
+    String columns are parsed with the frequency's fixed format first. If any
+    value doesn't match it, the column is parsed with pandas' format
+    inference instead, exactly as without a frequency. Invalid dates become
+    NaT.
+    
+    Args:
+        values: Column to parse
+        frequency: Dataset frequency code (e.g. "D", "M")
+        
+    Returns:
+        Datetime Series
+    """
+    date_format = FREQUENCY_DATE_FORMATS.get(frequency) if frequency else None
+    if date_format is None or pd.api.types.infer_dtype(values, skipna=True) != "string":
+        return as_datetime(values)
+    
+    parsed = pd.to_datetime(values, errors="coerce", format=date_format)
+    if (parsed.isna() & values.notna()).any():
+        return pd.to_datetime(values, errors="coerce")
+    return parsed
+
+
 def find_date_column(df: pd.DataFrame) -> Optional[str]:
     """
     Find date column in DataFrame (obs_time or obs_date).
@@ -20,6 +75,30 @@ def find_date_column(df: pd.DataFrame) -> Optional[str]:
     return None
 
 
+def _year_month_arrays(dates: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute year and month arrays from a datetime Series with integer arithmetic.
+    
+    Truncating to datetime64[M] gives months since 1970-01, so year and month
+    fall out of one division instead of two .dt accessor passes.
+    
+    Args:
+        dates: Datetime Series (tz-aware values use their local wall time)
+        
+    Returns:
+        Tuple of (years, months, valid) arrays; years/months are undefined
+        where valid is False (NaT)
+    """
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+    values = dates.to_numpy()
+    valid = ~np.isnat(values)
+    months_since_epoch = values.astype("datetime64[M]").view(np.int64)
+    years = 1970 + months_since_epoch // 12
+    months = months_since_epoch % 12 + 1
+    return years, months, valid
+
+
 def add_year_month_partitions(
     df: pd.DataFrame,
     date_col: str,
@@ -36,12 +115,52 @@ def add_year_month_partitions(
     Returns:
         DataFrame with year and month columns added
     """
-    df_with_partitions = df.copy()
-    df_with_partitions["year"] = pd.to_datetime(df[date_col], errors="coerce").dt.year
-    df_with_partitions["month"] = pd.to_datetime(df[date_col], errors="coerce").dt.month
+    # Parse once; assign returns a new frame, so the caller's is untouched
+    dates = as_datetime(df[date_col])
+    years, months, valid = _year_month_arrays(dates)
     
     if drop_invalid:
-        return df_with_partitions.dropna(subset=["year", "month"])
+        # Filter with the NaT mask already computed instead of a dropna pass
+        if not valid.all():
+            df, years, months = df[valid], years[valid], months[valid]
+        return df.assign(year=years, month=months)
     
-    return df_with_partitions
+    return df.assign(
+        year=pd.Series(years, index=df.index).where(valid),
+        month=pd.Series(months, index=df.index).where(valid),
+    )
+
 
+def year_month_partition_indices(
+    df: pd.DataFrame,
+    date_col: str,
+) -> dict[tuple[int, int], np.ndarray]:
+    """
+    Get row positions for each year/month partition of a date column.
+    
+    Unlike add_year_month_partitions, this doesn't add columns to (or copy)
+    the DataFrame; callers slice it with df.take(positions).
+    
+    Args:
+        df: DataFrame with date column
+        date_col: Name of date column
+        
+    Returns:
+        Dict mapping (year, month) to row positions, in order of first
+        appearance. Rows with invalid dates are excluded.
+    """
+    dates = as_datetime(df[date_col])
+    years, months, valid = _year_month_arrays(dates)
+    valid_positions = np.flatnonzero(valid)
+    years = years[valid_positions]
+    months = months[valid_positions]
+    
+    codes, uniques = pd.factorize(years * 100 + months)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+    groups = np.split(valid_positions[order], bounds)
+    
+    return {
+        divmod(packed, 100): positions
+        for packed, positions in zip(uniques.tolist(), groups)
+    }
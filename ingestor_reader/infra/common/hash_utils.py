@@ -12,18 +12,39 @@ def compute_file_hash(content: bytes) -> str:
     Returns:
         SHA256 hash as hex string
     """
-    return hashlib.sha256(content).hexdigest()
+    hasher = new_file_hasher()
+    hasher.update(content)
+    return hasher.hexdigest()
+
+
+def new_file_hasher() -> "hashlib._Hash":
+    """
+    Create an incremental hasher matching compute_file_hash.
+    
+    Feeding a file's chunks to update() yields the same hexdigest() as
+    compute_file_hash on the whole content.
+    
+    The hash only fingerprints content for change detection, so it is
+    flagged as not security-relevant (allowed on FIPS-restricted builds).
+    
+    Returns:
+        SHA256 hash object
+    """
+    return hashlib.sha256(usedforsecurity=False)
 
 
 def compute_string_hash(text: str) -> str:
     """
     Compute SHA256 hash of string.
     
+    Used for identifiers such as SNS deduplication IDs, so like
+    new_file_hasher it is flagged as not security-relevant.
+    
     Args:
         text: String to hash
         
     Returns:
         SHA256 hash as hex string
     """
-    return hashlib.sha256(text.encode()).hexdigest()
+    return hashlib.sha256(text.encode(), usedforsecurity=False).hexdigest()
 
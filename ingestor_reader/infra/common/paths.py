@@ -1,36 +1,49 @@
 """Centralized S3 path building."""
+from functools import lru_cache
 from typing import Optional
 
+PATH_CACHE_SIZE = 4096
+
 
 class S3PathBuilder:
-    """Builder for S3 paths following consistent structure."""
+    """
+    Builder for S3 paths following consistent structure.
+    
+    Key builders are pure functions of their arguments, so results are memoized.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def config_key(dataset_id: str) -> str:
         """Get config key."""
         return f"datasets/{dataset_id}/configs/config.yaml"
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def index_key(dataset_id: str) -> str:
         """Get index key."""
         return f"datasets/{dataset_id}/index/keys.parquet"
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def current_manifest_key(dataset_id: str) -> str:
         """Get current manifest pointer key."""
         return f"datasets/{dataset_id}/current/manifest.json"
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def events_prefix(dataset_id: str, version_ts: str) -> str:
         """Get events prefix."""
         return f"datasets/{dataset_id}/events/{version_ts}/data/"
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def event_manifest_key(dataset_id: str, version_ts: str) -> str:
         """Get event manifest key."""
         return f"datasets/{dataset_id}/events/{version_ts}/manifest.json"
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def event_manifest_pointer(dataset_id: str, version_ts: str) -> str:
         """
         Get manifest pointer path for an event (relative path without datasets/ prefix).
@@ -40,31 +53,43 @@ class S3PathBuilder:
         return f"{dataset_id}/events/{version_ts}/manifest.json"
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def projection_series_key(dataset_id: str, series_code: str, year: int, month: int) -> str:
         """Get projection series key."""
         return f"datasets/{dataset_id}/projections/windows/{series_code}/year={year}/month={month:02d}/data.parquet"
     
     @staticmethod
-    def projection_series_temp_key(dataset_id: str, series_code: str, year: int, month: int) -> str:
-        """Get projection series temporary key (WAL)."""
-        return f"datasets/{dataset_id}/projections/windows/{series_code}/year={year}/month={month:02d}/.tmp/data.parquet"
-    
-    @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def consolidation_manifest_key(dataset_id: str, year: int, month: int) -> str:
         """Get consolidation manifest key."""
         return f"datasets/{dataset_id}/projections/consolidation/{year}/{month:02d}/manifest.json"
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
+    def consolidation_pending_prefix(dataset_id: str) -> str:
+        """Get prefix of the markers of months whose consolidation hasn't completed."""
+        return f"datasets/{dataset_id}/projections/consolidation/pending/"
+    
+    @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
+    def consolidation_pending_key(dataset_id: str, year: int, month: int) -> str:
+        """Get pending consolidation marker key for a month."""
+        return f"datasets/{dataset_id}/projections/consolidation/pending/{year}-{month:02d}"
+    
+    @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def event_index_key(dataset_id: str, year: int, month: int) -> str:
         """Get event index key for a month."""
         return f"datasets/{dataset_id}/events/index/{year}/{month:02d}/versions.json"
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def event_partition_path(year: int, month: int) -> str:
         """Get event partition path (year=YYYY/month=MM/)."""
         return f"year={year}/month={month:02d}/"
     
     @staticmethod
+    @lru_cache(maxsize=PATH_CACHE_SIZE)
     def event_file_key(prefix: str, partition_path: Optional[str] = None) -> str:
         """Get event file key."""
         if partition_path:
@@ -20,13 +20,10 @@ def resolve_series_code(df: pd.DataFrame, config: DatasetConfig) -> pd.DataFrame
         DataFrame with internal_series_code column (added if missing)
     """
     if "internal_series_code" in df.columns:
-        return df.copy()
+        return df
     
     # Fallback: use dataset_id as default series_code
-    df = df.copy()
-    df["internal_series_code"] = config.dataset_id
-    
-    return df
+    return df.assign(internal_series_code=config.dataset_id)
 
 
 def get_series_code_column(df: pd.DataFrame) -> Optional[str]:
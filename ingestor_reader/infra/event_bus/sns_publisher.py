@@ -1,20 +1,40 @@
 """SNS event publisher."""
 import json
+from functools import lru_cache
 import boto3
+from botocore.config import Config
 from typing import Optional, Any
 
+SNS_CLIENT_CONFIG = Config(
+    max_pool_connections=16,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+
+@lru_cache(maxsize=None)
+def get_sns_client(region: Optional[str] = None):
+    """
+    Get the shared SNS client for a region.
+    
+    Reusing the client keeps its connections open across warm invocations,
+    like get_s3_client.
+    """
+    return boto3.client("sns", region_name=region, config=SNS_CLIENT_CONFIG)
+
 
 class SNSPublisher:
     """SNS event publisher."""
     
-    def __init__(self, region: Optional[str] = None):
+    def __init__(self, region: Optional[str] = None, sns_client=None):
         """
         Initialize SNS publisher.
         
         Args:
             region: AWS region
+            sns_client: SNS client to use (defaults to the shared client for region)
         """
-        self.sns_client = boto3.client("sns", region_name=region)
+        self.sns_client = sns_client or get_sns_client(region)
     
     def publish(
         self,
@@ -37,7 +57,7 @@ class SNSPublisher:
         Returns:
             Message ID
         """
-        message_json = json.dumps(message)
+        message_json = json.dumps(message, separators=(",", ":"))
         publish_params = {
             "TopicArn": topic_arn,
             "Message": message_json,
@@ -16,7 +16,13 @@ class DynamoDBLock:
     Lock expires automatically after TTL to prevent deadlocks.
     """
     
-    def __init__(self, table_name: str, region: Optional[str] = None, ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        table_name: str,
+        region: Optional[str] = None,
+        ttl_seconds: int = 3600,
+        consistent_read: bool = True,
+    ):
         """
         Initialize DynamoDB lock.
         
@@ -24,9 +30,12 @@ class DynamoDBLock:
             table_name: DynamoDB table name
             region: AWS region (defaults to boto3 default)
             ttl_seconds: Lock TTL in seconds (default: 1 hour)
+            consistent_read: Use strongly consistent reads when checking the
+                lock, so a just-released lock is never reported as held
         """
         self.table_name = table_name
         self.ttl_seconds = ttl_seconds
+        self.consistent_read = consistent_read
         self.dynamodb = boto3.resource("dynamodb", region_name=region)
         self.table = self.dynamodb.Table(table_name)
     
@@ -108,7 +117,9 @@ class DynamoDBLock:
             True if locked, False otherwise
         """
         try:
-            response = self.table.get_item(Key={"lock_key": lock_key})
+            response = self.table.get_item(
+                Key={"lock_key": lock_key}, ConsistentRead=self.consistent_read
+            )
             
             if "Item" not in response:
                 return False
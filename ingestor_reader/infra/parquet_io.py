@@ -1,15 +1,62 @@
 """Parquet I/O operations."""
 import io
+import struct
+from typing import Optional
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Trailer after the footer: 4-byte little-endian footer length + "PAR1" magic
+PARQUET_TRAILER_SIZE = 8
+PARQUET_MAGIC = b"PAR1"
 
 
 class ParquetIO:
     """Parquet I/O adapter."""
     
-    def read_from_bytes(self, data: bytes) -> pd.DataFrame:
-        """Read parquet from bytes."""
+    def read_from_bytes(self, data: bytes, columns: list[str] | None = None) -> pd.DataFrame:
+        """Read parquet from bytes (optionally only the given columns)."""
         buffer = io.BytesIO(data)
-        return pd.read_parquet(buffer)
+        return pd.read_parquet(buffer, columns=columns)
+    
+    def read_table_from_bytes(self, data: bytes, columns: list[str] | None = None) -> pa.Table:
+        """Read parquet from bytes as an Arrow table (no pandas conversion)."""
+        return pq.read_table(pa.BufferReader(data), columns=columns)
+    
+    def footer_size(self, tail: bytes) -> Optional[int]:
+        """
+        Get the size of a Parquet file's footer from its trailing bytes.
+        
+        Args:
+            tail: Last bytes of a Parquet file (at least the 8-byte trailer)
+            
+        Returns:
+            Footer size in bytes, trailer included, or None if tail doesn't
+            end with a Parquet trailer
+        """
+        if len(tail) < PARQUET_TRAILER_SIZE or tail[-4:] != PARQUET_MAGIC:
+            return None
+        return struct.unpack("<I", tail[-PARQUET_TRAILER_SIZE:-4])[0] + PARQUET_TRAILER_SIZE
+    
+    def read_metadata_from_tail(self, tail: bytes) -> Optional[pq.ParquetFile]:
+        """
+        Open a Parquet file from its trailing bytes, for footer metadata only.
+        
+        Only the schema and row group metadata (including column statistics)
+        can be used; data pages are not available.
+        
+        Args:
+            tail: Last bytes of a Parquet file
+            
+        Returns:
+            ParquetFile, or None if the tail doesn't hold the whole footer
+        """
+        footer_size = self.footer_size(tail)
+        if footer_size is None or footer_size > len(tail):
+            return None
+        # The reader only checks the trailing magic, so the leading one is just
+        # there to make the buffer look like a whole file
+        return pq.ParquetFile(io.BytesIO(PARQUET_MAGIC + tail[-footer_size:]))
     
     def write_to_bytes(self, df: pd.DataFrame) -> bytes:
         """Write parquet to bytes."""
@@ -17,6 +64,20 @@ class ParquetIO:
         df.to_parquet(buffer, index=False, engine="pyarrow")
         return buffer.getvalue()
     
+    def write_to_buffer(self, df: pd.DataFrame, **write_options) -> pa.Buffer:
+        """
+        Write parquet to an Arrow buffer (avoids the intermediate bytes copy).
+        
+        Args:
+            df: DataFrame to write
+            **write_options: Extra options for pyarrow.parquet.write_table
+                (e.g. compression, row_group_size)
+        """
+        sink = pa.BufferOutputStream()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, sink, **write_options)
+        return sink.getvalue()
+    
     def read_from_path(self, path: str) -> pd.DataFrame:
         """Read parquet from file path or S3 URI."""
         return pd.read_parquet(path, engine="pyarrow")
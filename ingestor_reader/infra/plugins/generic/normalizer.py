@@ -2,7 +2,7 @@
 import pandas as pd
 
 from ingestor_reader.domain.plugins.base import NormalizerPlugin
-from ingestor_reader.infra.common import get_logger
+from ingestor_reader.infra.common import get_logger, parse_dates
 
 logger = get_logger(__name__)
 
@@ -26,13 +26,13 @@ class GenericNormalizer(NormalizerPlugin):
         This is a generic normalizer that handles standard date/value normalization.
         It can be used for datasets that don't require custom normalization logic.
         """
-        logger.info(f"Normalizing {len(df)} rows")
+        logger.info("Normalizing %d rows", len(df))
         
         df = df.copy()
         
         # Parse dates
         if "obs_time" in df.columns:
-            df["obs_time"] = pd.to_datetime(df["obs_time"], errors="coerce")
+            df["obs_time"] = parse_dates(df["obs_time"], config.frequency)
         
         # Parse numeric values
         if "value" in df.columns:
@@ -45,6 +45,6 @@ class GenericNormalizer(NormalizerPlugin):
         # Drop rows with missing required fields
         df = df.dropna(subset=["obs_time", "value"])
         
-        logger.info(f"Normalized to {len(df)} rows")
+        logger.info("Normalized to %d rows", len(df))
         return df
 
@@ -16,11 +16,25 @@ class S3Catalog:
     delegating to specialized stores for better organization and maintainability.
     """
     
-    def __init__(self, s3_storage: S3Storage):
-        """Initialize S3 catalog with specialized stores."""
+    def __init__(
+        self,
+        s3_storage: S3Storage,
+        memoize_manifests: bool = False,
+        memoize_index: bool = False,
+    ):
+        """
+        Initialize S3 catalog with specialized stores.
+        
+        Args:
+            s3_storage: S3 storage instance
+            memoize_manifests: Fetch each manifest (and its ETag) at most once
+                for the lifetime of this catalog; use for a single locked run
+            memoize_index: Download the index at most once and keep the last
+                written copy in memory; use for a single locked run
+        """
         self.s3 = s3_storage
-        self._manifest_store = S3ManifestStore(s3_storage)
-        self._index_store = S3IndexStore(s3_storage)
+        self._manifest_store = S3ManifestStore(s3_storage, memoize=memoize_manifests)
+        self._index_store = S3IndexStore(s3_storage, memoize=memoize_index)
         self._event_store = S3EventStore(s3_storage)
         self._projection_store = S3ProjectionStore(s3_storage)
     
@@ -97,9 +111,9 @@ class S3Catalog:
         """Update event index for a month (internal, exposed for testing)."""
         return self._event_store._update_event_index(dataset_id, year, month, version_ts)
     
-    def _write_event_files(self, prefix: str, df_with_partitions, affected_months: set, event_keys: list[str]) -> None:
+    def _write_event_files(self, prefix: str, df, date_col: str, affected_months: set, event_keys: list[str]) -> None:
         """Write event files for each partition (internal, exposed for testing)."""
-        return self._event_store._write_event_files(prefix, df_with_partitions, affected_months, event_keys)
+        return self._event_store._write_event_files(prefix, df, date_col, affected_months, event_keys)
     
     def _rollback_events(self, event_keys: list[str]) -> None:
         """Delete all written events on rollback (internal, exposed for testing)."""
@@ -113,22 +127,18 @@ class S3Catalog:
         """Read series projection."""
         return self._projection_store.read_series_projection(dataset_id, series_code, year, month)
     
+    def iter_projection_tables(self, dataset_id: str, year: int, month: int, columns=None):
+        """Lazily read the projection of every series for a month as Arrow tables."""
+        return self._projection_store.iter_projection_tables(dataset_id, year, month, columns)
+    
+    def read_projection(self, dataset_id: str, year: int, month: int, columns=None):
+        """Read the projections of every series for a month as one DataFrame."""
+        return self._projection_store.read_projection(dataset_id, year, month, columns)
+    
     def write_series_projection(self, dataset_id: str, series_code: str, year: int, month: int, df):
         """Write series projection."""
         return self._projection_store.write_series_projection(dataset_id, series_code, year, month, df)
     
-    def write_series_projection_temp(self, dataset_id: str, series_code: str, year: int, month: int, df):
-        """Write series projection to temporary location (WAL)."""
-        return self._projection_store.write_series_projection_temp(dataset_id, series_code, year, month, df)
-    
-    def move_series_projection_from_temp(self, dataset_id: str, series_code: str, year: int, month: int):
-        """Move series projection from temporary to final location (atomic)."""
-        return self._projection_store.move_series_projection_from_temp(dataset_id, series_code, year, month)
-    
-    def cleanup_temp_projections(self, dataset_id: str, year: int, month: int) -> None:
-        """Clean up temporary projections for a month."""
-        return self._projection_store.cleanup_temp_projections(dataset_id, year, month)
-    
     def read_consolidation_manifest(self, dataset_id: str, year: int, month: int):
         """Read consolidation manifest."""
         return self._projection_store.read_consolidation_manifest(dataset_id, year, month)
@@ -137,6 +147,18 @@ class S3Catalog:
         """Write consolidation manifest."""
         return self._projection_store.write_consolidation_manifest(dataset_id, year, month, status)
     
+    def mark_consolidation_pending(self, dataset_id: str, year: int, month: int) -> None:
+        """Write the marker of a month whose consolidation has started."""
+        return self._projection_store.mark_consolidation_pending(dataset_id, year, month)
+    
+    def clear_consolidation_pending(self, dataset_id: str, year: int, month: int) -> None:
+        """Remove the pending consolidation marker of a month."""
+        return self._projection_store.clear_consolidation_pending(dataset_id, year, month)
+    
+    def list_pending_consolidations(self, dataset_id: str) -> list[tuple[int, int]]:
+        """List months whose consolidation was started but never completed."""
+        return self._projection_store.list_pending_consolidations(dataset_id)
+    
     # ============================================================================
     # Compatibility: Expose stores for direct access if needed
     # ============================================================================
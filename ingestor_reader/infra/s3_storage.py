@@ -1,7 +1,43 @@
 """S3 storage operations."""
+import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import boto3
+import pyarrow as pa
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional
+
+from ingestor_reader.infra.common.errors import StorageError
+
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 16
+DELETE_BATCH_SIZE = 1000
+LIST_PAGE_SIZE = 1000
+DELETE_MAX_WORKERS = 16
+S3_MAX_POOL_CONNECTIONS = 64
+
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+    s3={"addressing_style": "virtual"},
+)
+
+
+@lru_cache(maxsize=None)
+def get_s3_client(region: Optional[str] = None):
+    """
+    Get the shared S3 client for a region.
+    
+    boto3 clients are thread-safe, so one client (and its connection pool)
+    is reused by every S3Storage instance and across warm invocations.
+    """
+    return boto3.client("s3", region_name=region, config=S3_CLIENT_CONFIG)
 
 
 class S3Storage:
@@ -16,47 +52,101 @@ class S3Storage:
             region: AWS region (defaults to boto3 default)
         """
         self.bucket = bucket
-        self.s3_client = boto3.client("s3", region_name=region)
+        self.s3_client = get_s3_client(region)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            max_concurrency=MULTIPART_MAX_CONCURRENCY,
+        )
     
     def get_object(self, key: str) -> bytes:
         """Get object from S3."""
         response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
         return response["Body"].read()
     
+    def get_object_range(self, key: str, byte_range: str) -> bytes:
+        """
+        Get part of an object from S3.
+        
+        Args:
+            key: S3 key
+            byte_range: HTTP Range value (e.g. "bytes=-65536" for the last 64 KiB;
+                the whole object is returned if it is smaller)
+            
+        Returns:
+            Requested bytes
+        """
+        response = self.s3_client.get_object(Bucket=self.bucket, Key=key, Range=byte_range)
+        return response["Body"].read()
+    
+    def get_object_conditional(
+        self, key: str, if_none_match: Optional[str] = None
+    ) -> tuple[Optional[bytes], str]:
+        """
+        Get object from S3 unless it still matches a known ETag.
+        
+        Args:
+            key: S3 key
+            if_none_match: ETag of a previously read copy (If-None-Match)
+            
+        Returns:
+            Tuple of (body, ETag). Body is None if the object is unchanged (304).
+        """
+        extra_args = {}
+        if if_none_match:
+            extra_args["IfNoneMatch"] = f'"{if_none_match}"'
+        
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=key, **extra_args)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if if_none_match and error_code in ("304", "NotModified"):
+                return None, if_none_match
+            raise
+        return response["Body"].read(), response["ETag"].strip('"')
+    
     def put_object(
         self,
         key: str,
-        body: bytes,
+        body: bytes | BinaryIO,
         content_type: Optional[str] = None,
         if_match: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
     ) -> str:
         """
         Put object to S3 with optional conditional header.
         
+        Unconditional bytes bodies above the multipart threshold are sent as
+        a concurrent multipart upload instead of a single PUT.
+        
         Args:
             key: S3 key
-            body: Object body
+            body: Object body (bytes or file-like)
             content_type: Content type
             if_match: ETag for conditional PUT (If-Match)
+            metadata: User metadata to store with the object
             
         Returns:
             ETag of uploaded object
             
         Raises:
-            ClientError: If conditional check fails (412)
+            ValueError: If conditional check fails (412)
         """
-
-        if if_match:
-            current_meta = self.head_object(key)
-            if current_meta is None:
-
-                pass
-            elif current_meta["ETag"] != if_match:
-                raise ValueError("Conditional PUT failed: ETag mismatch")
-        
         extra_args = {}
         if content_type:
             extra_args["ContentType"] = content_type
+        if if_match:
+            extra_args["IfMatch"] = f'"{if_match}"'
+        if metadata:
+            extra_args["Metadata"] = metadata
+        
+        if (
+            not if_match
+            and isinstance(body, (bytes, bytearray))
+            and len(body) >= MULTIPART_THRESHOLD
+        ):
+            self._upload_multipart(key, io.BytesIO(body), extra_args)
+            return self.head_object(key)["ETag"]
         
         try:
             response = self.s3_client.put_object(
@@ -67,20 +157,62 @@ class S3Storage:
             )
             return response["ETag"].strip('"')
         except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if if_match and error_code in ("412", "PreconditionFailed", "NoSuchKey"):
+                raise ValueError("Conditional PUT failed: ETag mismatch") from e
             raise
     
+    def put_object_stream(
+        self,
+        key: str,
+        buffer: pa.Buffer,
+        content_type: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> None:
+        """
+        Upload an Arrow buffer without materializing it as bytes.
+        
+        Buffers below the multipart threshold go through a single PUT;
+        larger ones use a managed multipart upload.
+        
+        Args:
+            key: S3 key
+            buffer: Arrow buffer with the object body
+            content_type: Content type
+            metadata: User metadata to store with the object
+        """
+        reader = pa.BufferReader(buffer)
+        if buffer.size < MULTIPART_THRESHOLD:
+            self.put_object(key, reader, content_type=content_type, metadata=metadata)
+            return
+        
+        extra_args = {}
+        if content_type:
+            extra_args["ContentType"] = content_type
+        if metadata:
+            extra_args["Metadata"] = metadata
+        
+        self._upload_multipart(key, reader, extra_args)
+    
+    def _upload_multipart(self, key: str, fileobj: BinaryIO, extra_args: dict) -> None:
+        """Upload a file-like object using a managed (concurrent) multipart upload."""
+        self.s3_client.upload_fileobj(
+            fileobj, self.bucket, key, ExtraArgs=extra_args, Config=self.transfer_config
+        )
+    
     def head_object(self, key: str) -> Optional[dict]:
         """
         Head object to get metadata.
         
         Returns:
-            Metadata dict with ETag, or None if not found
+            Metadata dict with ETag, ContentLength and user Metadata, or None if not found
         """
         try:
             response = self.s3_client.head_object(Bucket=self.bucket, Key=key)
             return {
                 "ETag": response["ETag"].strip('"'),
                 "ContentLength": response["ContentLength"],
+                "Metadata": response.get("Metadata", {}),
             }
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -90,14 +222,58 @@ class S3Storage:
     
     def list_objects(self, prefix: str) -> list[str]:
         """List objects with prefix."""
-        keys = []
+        return list(self.iter_objects(prefix))
+    
+    def iter_objects(self, prefix: str) -> Iterator[str]:
+        """
+        Lazily iterate object keys with prefix, one LIST page at a time.
+        
+        Args:
+            prefix: Key prefix (end it with "/" to match a single "directory")
+            
+        Yields:
+            Object keys in lexicographic order
+        """
         paginator = self.s3_client.get_paginator("list_objects_v2")
-        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
-            if "Contents" in page:
-                keys.extend([obj["Key"] for obj in page["Contents"]])
-        return keys
+        pages = paginator.paginate(
+            Bucket=self.bucket, Prefix=prefix, PaginationConfig={"PageSize": LIST_PAGE_SIZE}
+        )
+        for page in pages:
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
     
     def delete_object(self, key: str) -> None:
         """Delete object from S3."""
         self.s3_client.delete_object(Bucket=self.bucket, Key=key)
-
+    
+    def delete_objects(self, keys: list[str]) -> None:
+        """
+        Delete multiple objects using batched DeleteObjects requests.
+        
+        Keys are sent in batches of up to 1000 (the S3 limit); multiple
+        batches are deleted concurrently.
+        
+        Raises:
+            StorageError: If S3 reports any key that could not be deleted
+        """
+        batches = [
+            keys[i:i + DELETE_BATCH_SIZE] for i in range(0, len(keys), DELETE_BATCH_SIZE)
+        ]
+        if len(batches) <= 1:
+            for batch in batches:
+                self._delete_batch(batch)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(len(batches), DELETE_MAX_WORKERS)) as executor:
+            list(executor.map(self._delete_batch, batches))
+    
+    def _delete_batch(self, keys: list[str]) -> None:
+        """Delete a single batch of up to 1000 objects."""
+        response = self.s3_client.delete_objects(
+            Bucket=self.bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+        errors = response.get("Errors", [])
+        if errors:
+            failed = ", ".join(error["Key"] for error in errors)
+            raise StorageError(f"Failed to delete {len(errors)} object(s): {failed}")
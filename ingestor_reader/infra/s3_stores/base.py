@@ -1,7 +1,10 @@
 """Base S3 store with common operations."""
 import json
+import threading
+from collections import OrderedDict
 from typing import Optional
 import pandas as pd
+import pyarrow as pa
 from botocore.exceptions import ClientError
 
 from ingestor_reader.infra.s3_storage import S3Storage
@@ -9,6 +12,8 @@ from ingestor_reader.infra.parquet_io import ParquetIO
 from ingestor_reader.infra.common.paths import S3PathBuilder
 from ingestor_reader.infra.common.clock import Clock, get_clock
 
+JSON_CACHE_SIZE = 128
+
 
 class S3BaseStore:
     """Base class for S3 stores with common operations."""
@@ -31,6 +36,9 @@ class S3BaseStore:
         self.parquet_io = ParquetIO()
         self.paths = paths or S3PathBuilder()
         self.clock = clock or get_clock()
+        self._json_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        # Stores are shared by concurrent consolidation workers
+        self._json_cache_lock = threading.Lock()
     
     @staticmethod
     def _is_not_found_error(error: ClientError) -> bool:
@@ -39,34 +47,103 @@ class S3BaseStore:
         return error_code in ("404", "NoSuchKey")
     
     def _read_json(self, key: str) -> Optional[dict]:
-        """Read JSON object from S3 with error handling."""
+        """
+        Read JSON object from S3 with error handling.
+        
+        Bodies are cached by ETag; repeated reads issue a conditional GET
+        (If-None-Match) and reuse the cached body when S3 answers 304.
+        """
+        return self._read_json_with_etag(key)[0]
+    
+    def _read_json_with_etag(self, key: str) -> tuple[Optional[dict], Optional[str]]:
+        """
+        Read JSON object from S3 together with its ETag.
+        
+        Returns:
+            Tuple of (data, ETag); both None if the object does not exist.
+            Data is None with an ETag if the body is not valid JSON.
+        """
+        with self._json_cache_lock:
+            cached = self._json_cache.get(key)
         try:
-            body = self.s3.get_object(key)
-            return json.loads(body.decode())
+            body, etag = self.s3.get_object_conditional(
+                key, if_none_match=cached[0] if cached else None
+            )
         except ClientError as e:
             if self._is_not_found_error(e):
-                return None
+                self._invalidate_json(key)
+                return None, None
             raise
+        
+        if body is None:
+            body = cached[1]
+        self._cache_json(key, etag, body)
+        
+        try:
+            return json.loads(body.decode()), etag
         except json.JSONDecodeError:
-            return None
+            return None, etag
     
-    def _read_parquet(self, key: str) -> Optional[pd.DataFrame]:
-        """Read Parquet object from S3 with error handling."""
+    def _cache_json(self, key: str, etag: str, body: bytes) -> None:
+        """Store a JSON body in the LRU cache, evicting the oldest entry if full."""
+        with self._json_cache_lock:
+            self._json_cache[key] = (etag, body)
+            self._json_cache.move_to_end(key)
+            if len(self._json_cache) > JSON_CACHE_SIZE:
+                self._json_cache.popitem(last=False)
+    
+    def _invalidate_json(self, key: str) -> None:
+        """Drop a cached JSON body after it has been overwritten."""
+        with self._json_cache_lock:
+            self._json_cache.pop(key, None)
+    
+    def _get_object_or_none(self, key: str) -> Optional[bytes]:
+        """Get object bytes from S3, or None if the key does not exist."""
         try:
-            body = self.s3.get_object(key)
-            return self.parquet_io.read_from_bytes(body)
+            return self.s3.get_object(key)
         except ClientError as e:
             if self._is_not_found_error(e):
                 return None
             raise
     
+    def _read_parquet(self, key: str) -> Optional[pd.DataFrame]:
+        """Read Parquet object from S3 with error handling."""
+        body = self._get_object_or_none(key)
+        if body is None:
+            return None
+        return self.parquet_io.read_from_bytes(body)
+    
+    def _read_parquet_table(self, key: str, columns: Optional[list[str]] = None) -> Optional[pa.Table]:
+        """Read Parquet object (optionally only some columns) as an Arrow table, or None if it does not exist."""
+        body = self._get_object_or_none(key)
+        if body is None:
+            return None
+        return self.parquet_io.read_table_from_bytes(body, columns=columns)
+    
     def _write_json(self, key: str, data: dict) -> None:
         """Write JSON object to S3."""
         body = json.dumps(data, indent=2).encode()
+        self._invalidate_json(key)
         self.s3.put_object(key, body, content_type="application/json")
     
-    def _write_parquet(self, key: str, df: pd.DataFrame) -> None:
-        """Write Parquet object to S3."""
-        body = self.parquet_io.write_to_bytes(df)
-        self.s3.put_object(key, body, content_type="application/x-parquet")
+    def _write_parquet(
+        self,
+        key: str,
+        df: pd.DataFrame,
+        metadata: Optional[dict[str, str]] = None,
+        write_options: Optional[dict] = None,
+    ) -> None:
+        """
+        Write Parquet object to S3.
+        
+        Args:
+            key: S3 key
+            df: DataFrame to write
+            metadata: User metadata to store with the object
+            write_options: Extra pyarrow.parquet.write_table options
+        """
+        body = self.parquet_io.write_to_buffer(df, **(write_options or {}))
+        self.s3.put_object_stream(
+            key, body, content_type="application/x-parquet", metadata=metadata
+        )
 
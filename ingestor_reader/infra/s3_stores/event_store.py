@@ -3,7 +3,7 @@ from typing import Optional
 import pandas as pd
 
 from ingestor_reader.infra.s3_stores.base import S3BaseStore
-from ingestor_reader.infra.common.dataframe_utils import find_date_column, add_year_month_partitions
+from ingestor_reader.infra.common.dataframe_utils import find_date_column, year_month_partition_indices
 
 
 class S3EventStore(S3BaseStore):
@@ -39,12 +39,11 @@ class S3EventStore(S3BaseStore):
         self, dataset_id: str, version_ts: str, prefix: str, df: pd.DataFrame, date_col: str
     ) -> list[str]:
         """Write partitioned events with rollback on failure."""
-        df_with_partitions = add_year_month_partitions(df, date_col)
         event_keys = []
         affected_months = set()
         
         try:
-            self._write_event_files(prefix, df_with_partitions, affected_months, event_keys)
+            self._write_event_files(prefix, df, date_col, affected_months, event_keys)
             self._update_event_indexes(dataset_id, version_ts, affected_months)
             return event_keys
         except Exception:
@@ -52,16 +51,18 @@ class S3EventStore(S3BaseStore):
             raise
     
     def _write_event_files(
-        self, prefix: str, df_with_partitions: pd.DataFrame, affected_months: set, event_keys: list[str]
+        self, prefix: str, df: pd.DataFrame, date_col: str, affected_months: set, event_keys: list[str]
     ) -> None:
         """Write event files for each partition."""
-        for (year, month), group_df in df_with_partitions.groupby(["year", "month"]):
-            group_df_clean = group_df.drop(columns=["year", "month"])
+        partitions = year_month_partition_indices(df, date_col)
+        for (year, month), positions in partitions.items():
+            # Slice by row positions; no partition columns to add or drop
+            group_df = df if len(positions) == len(df) else df.take(positions)
             partition_path = self.paths.event_partition_path(year, month)
             key = self.paths.event_file_key(prefix, partition_path)
             
             # Write event first (may raise exception)
-            self._write_parquet(key, group_df_clean)
+            self._write_parquet(key, group_df)
             
             # Only add key after successful write
             event_keys.append(key)
@@ -87,11 +88,12 @@ class S3EventStore(S3BaseStore):
     
     def _rollback_events(self, event_keys: list[str]) -> None:
         """Delete all written events on rollback."""
-        for key in event_keys:
-            try:
-                self.s3.delete_object(key)
-            except Exception:
-                pass  # Ignore errors during rollback
+        if not event_keys:
+            return
+        try:
+            self.s3.delete_objects(event_keys)
+        except Exception:
+            pass  # Ignore errors during rollback
     
     def list_events_for_month(self, dataset_id: str, year: int, month: int) -> list[str]:
         """
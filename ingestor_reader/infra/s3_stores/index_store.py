@@ -3,27 +3,76 @@ from typing import Optional
 import pandas as pd
 
 from ingestor_reader.infra.s3_stores.base import S3BaseStore
+from ingestor_reader.infra.common.concurrency import prefetch_map
+
+REBUILD_WORKERS = 4
+ROWS_METADATA_KEY = "rows"
 
 
 class S3IndexStore(S3BaseStore):
     """S3 store for index operations."""
     
+    def __init__(self, *args, memoize: bool = False, **kwargs):
+        """
+        Initialize index store.
+        
+        Args:
+            memoize: If True, the index is downloaded at most once and the
+                in-memory copy is reused (and replaced on write). Only safe
+                while the caller is the single writer.
+        """
+        super().__init__(*args, **kwargs)
+        self.memoize = memoize
+        self._index_memo: dict[str, Optional[pd.DataFrame]] = {}
+    
     def read_index(self, dataset_id: str) -> Optional[pd.DataFrame]:
-        """Read index DataFrame."""
+        """Read index DataFrame (callers must not mutate it when memoized)."""
+        if dataset_id in self._index_memo:
+            return self._index_memo[dataset_id]
+        
         key = self.paths.index_key(dataset_id)
-        return self._read_parquet(key)
+        index_df = self._read_parquet(key)
+        if self.memoize:
+            self._index_memo[dataset_id] = index_df
+        return index_df
     
     def write_index(self, dataset_id: str, df: pd.DataFrame) -> None:
-        """Write index DataFrame."""
+        """Write index DataFrame (row count is stored as object metadata)."""
         key = self.paths.index_key(dataset_id)
-        self._write_parquet(key, df)
+        self._index_memo.pop(dataset_id, None)
+        self._write_parquet(key, df, metadata={ROWS_METADATA_KEY: str(len(df))})
+        if self.memoize:
+            self._index_memo[dataset_id] = df
+    
+    def read_index_row_count(self, dataset_id: str) -> Optional[int]:
+        """
+        Get the number of rows in the index without downloading it.
+        
+        Uses the row count stored in object metadata on write; falls back to
+        reading the index for objects written without it.
+        """
+        if dataset_id in self._index_memo:
+            index_df = self._index_memo[dataset_id]
+            return len(index_df) if index_df is not None else None
+        
+        key = self.paths.index_key(dataset_id)
+        metadata = self.s3.head_object(key)
+        if metadata is None:
+            return None
+        
+        rows = metadata.get("Metadata", {}).get(ROWS_METADATA_KEY)
+        if rows is not None:
+            return int(rows)
+        
+        index_df = self.read_index(dataset_id)
+        return len(index_df) if index_df is not None else None
     
     def verify_pointer_index_consistency(self, dataset_id: str, manifest_store) -> bool:
         """Verify consistency between pointer and index."""
         pointer = manifest_store.read_current_manifest(dataset_id)
         if pointer is None:
-            index_df = self.read_index(dataset_id)
-            return index_df is None or len(index_df) == 0
+            index_rows = self.read_index_row_count(dataset_id)
+            return index_rows is None or index_rows == 0
         
         current_version = pointer.get("current_version")
         if current_version is None:
@@ -33,14 +82,13 @@ class S3IndexStore(S3BaseStore):
         if manifest is None:
             return False
         
-        index_df = self.read_index(dataset_id)
-        if index_df is None:
+        index_rows = self.read_index_row_count(dataset_id)
+        if index_rows is None:
             return False
         
         expected_rows = manifest.get("outputs", {}).get("rows_total") if isinstance(manifest, dict) else None
         if expected_rows is not None:
-            actual_rows = len(index_df)
-            return abs(actual_rows - expected_rows) <= 10
+            return abs(index_rows - expected_rows) <= 10
         
         return True
     
@@ -62,8 +110,7 @@ class S3IndexStore(S3BaseStore):
         if primary_keys is None:
             return
         
-        # Collect all events from all versions up to current
-        all_events = []
+        # Collect all event keys from all versions up to current
         prefix = f"datasets/{dataset_id}/events/"
         all_keys = self.s3.list_objects(prefix)
         
@@ -76,29 +123,38 @@ class S3IndexStore(S3BaseStore):
         
         sorted_versions = sorted(version_timestamps)
         
-        # Read events from all versions up to current
+        event_keys = []
         for version_ts in sorted_versions:
             if version_ts > current_version:
                 break
             
             version_prefix = self.paths.events_prefix(dataset_id, version_ts)
-            for key in all_keys:
-                if key.startswith(version_prefix) and key.endswith(".parquet"):
-                    df = self._read_parquet(key)
-                    if df is not None and len(df) > 0:
-                        all_events.append(df)
+            event_keys.extend(
+                key for key in all_keys
+                if key.startswith(version_prefix) and key.endswith(".parquet")
+            )
         
-        if not all_events:
-            return
+        from ingestor_reader.domain.services.delta_service import compute_key_hashes
         
-        # Concatenate and compute key_hash
-        combined_df = pd.concat(all_events, ignore_index=True)
-        from ingestor_reader.domain.services.delta_service import compute_key_hash
-        combined_df["key_hash"] = combined_df.apply(
-            lambda row: compute_key_hash(row, primary_keys), axis=1
-        )
+        # Download in the background while decoding already-fetched files,
+        # keeping only key hashes not seen in earlier events (first occurrence wins)
+        seen_hashes: set[str] = set()
+        key_hashes: list[str] = []
+        for body in prefetch_map(self._get_object_or_none, event_keys, max_workers=REBUILD_WORKERS):
+            if body is None:
+                continue
+            df = self.parquet_io.read_from_bytes(body, columns=primary_keys)
+            if len(df) == 0:
+                continue
+            
+            for key_hash in compute_key_hashes(df, primary_keys):
+                if key_hash not in seen_hashes:
+                    seen_hashes.add(key_hash)
+                    key_hashes.append(key_hash)
+        
+        if not key_hashes:
+            return
         
         # Create index with unique key_hashes
-        index_df = combined_df[["key_hash"]].drop_duplicates(subset=["key_hash"], keep="first")
+        index_df = pd.DataFrame({"key_hash": key_hashes})
         self.write_index(dataset_id, index_df)
-
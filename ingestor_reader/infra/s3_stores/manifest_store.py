@@ -1,7 +1,6 @@
 """S3 manifest store operations."""
 import json
 from typing import Optional
-from botocore.exceptions import ClientError
 
 from ingestor_reader.domain.entities.manifest import Manifest
 from ingestor_reader.infra.s3_stores.base import S3BaseStore
@@ -10,43 +9,72 @@ from ingestor_reader.infra.s3_stores.base import S3BaseStore
 class S3ManifestStore(S3BaseStore):
     """S3 store for manifest operations."""
     
+    def __init__(self, *args, memoize: bool = False, **kwargs):
+        """
+        Initialize manifest store.
+        
+        Args:
+            memoize: If True, each manifest is fetched at most once and its
+                body and ETag reused until this store overwrites it. Only
+                safe while the caller is the single writer (e.g. a pipeline
+                run holding the dataset lock).
+        """
+        super().__init__(*args, **kwargs)
+        self.memoize = memoize
+        self._manifest_memo: dict[str, tuple[Optional[dict], Optional[str]]] = {}
+    
+    def _read_manifest(self, key: str) -> tuple[Optional[dict], Optional[str]]:
+        """Read a manifest and its ETag, memoized when enabled."""
+        if not self.memoize:
+            return self._read_json_with_etag(key)
+        if key not in self._manifest_memo:
+            self._manifest_memo[key] = self._read_json_with_etag(key)
+        return self._manifest_memo[key]
+    
+    def _forget_manifest(self, key: str) -> None:
+        """Drop cached copies of a manifest that is being overwritten."""
+        self._invalidate_json(key)
+        self._manifest_memo.pop(key, None)
+    
     def get_current_manifest_etag(self, dataset_id: str) -> Optional[str]:
-        """Get ETag of current manifest."""
+        """Get ETag of current manifest (reuses a memoized read when available)."""
         key = self.paths.current_manifest_key(dataset_id)
+        if key in self._manifest_memo:
+            return self._manifest_memo[key][1]
         metadata = self.s3.head_object(key)
         return metadata["ETag"] if metadata else None
     
     def read_current_manifest(self, dataset_id: str) -> Optional[dict]:
         """Read current manifest pointer."""
         key = self.paths.current_manifest_key(dataset_id)
-        return self._read_json(key)
+        return self._read_manifest(key)[0]
     
     def put_current_manifest_pointer(
         self, dataset_id: str, body: dict, if_match_etag: Optional[str]
     ) -> str:
-        """Update current manifest pointer with CAS."""
+        """Update current manifest pointer with CAS (the new ETag is memoized when enabled)."""
         key = self.paths.current_manifest_key(dataset_id)
         body_bytes = json.dumps(body, indent=2).encode()
-        try:
-            return self.s3.put_object(
-                key, body_bytes, content_type="application/json", if_match=if_match_etag
-            )
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "412":
-                raise ValueError("Conditional PUT failed: ETag mismatch") from e
-            raise
+        self._forget_manifest(key)
+        # put_object raises ValueError on an ETag mismatch (412)
+        etag = self.s3.put_object(
+            key, body_bytes, content_type="application/json", if_match=if_match_etag
+        )
+        if self.memoize:
+            self._manifest_memo[key] = (body, etag)
+        return etag
     
     def write_event_manifest(self, dataset_id: str, version_ts: str, manifest: Manifest) -> None:
         """Write event manifest."""
         key = self.paths.event_manifest_key(dataset_id, version_ts)
         body = manifest.model_dump_json(indent=2)
+        self._forget_manifest(key)
         self.s3.put_object(key, body.encode(), content_type="application/json")
     
     def read_event_manifest(self, dataset_id: str, version_ts: str) -> Optional[dict]:
         """Read event manifest."""
         key = self.paths.event_manifest_key(dataset_id, version_ts)
-        return self._read_json(key)
+        return self._read_manifest(key)[0]
     
     def get_event_manifest_pointer(self, dataset_id: str, version_ts: str) -> str:
         """Get manifest pointer path for an event (for SNS notifications)."""
@@ -1,10 +1,23 @@
 """S3 projection store operations."""
-from typing import Optional
+from functools import partial
+from typing import Iterator, Optional
 import pandas as pd
-from botocore.exceptions import ClientError
+import pyarrow as pa
 
+from ingestor_reader.infra.common.concurrency import prefetch_map
 from ingestor_reader.infra.s3_stores.base import S3BaseStore
 
+# Projection shards are small (one series-month), so each is written as a
+# single row group with zstd instead of the default snappy settings
+PROJECTION_PARQUET_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "data_page_size": 256 * 1024,
+}
+
+PROJECTION_READ_WORKERS = 16
+
 
 class S3ProjectionStore(S3BaseStore):
     """S3 store for projection operations."""
@@ -16,51 +29,74 @@ class S3ProjectionStore(S3BaseStore):
         key = self.paths.projection_series_key(dataset_id, series_code, year, month)
         return self._read_parquet(key)
     
+    def iter_projection_tables(
+        self, dataset_id: str, year: int, month: int, columns: Optional[list[str]] = None
+    ) -> Iterator[pa.Table]:
+        """
+        Lazily read the projection of every series for a month, in key order.
+        
+        Series are downloaded and decoded concurrently, with only a bounded
+        number of tables in flight, so callers can stream them to disk.
+        
+        Args:
+            dataset_id: Dataset ID
+            year: Year
+            month: Month
+            columns: Columns to decode (all if None)
+            
+        Yields:
+            One Arrow table per series projection
+        """
+        # Keys are laid out as windows/{series_code}/year=Y/month=MM/, so the
+        # month isn't part of the LIST prefix. LIST returns keys in sorted
+        # order, so GETs start as soon as the first page arrives instead of
+        # after the whole listing
+        prefix = f"datasets/{dataset_id}/projections/windows/"
+        suffix = f"/year={year}/month={month:02d}/data.parquet"
+        keys = (key for key in self.s3.iter_objects(prefix) if key.endswith(suffix))
+        
+        tables = prefetch_map(
+            partial(self._read_parquet_table, columns=columns), keys, max_workers=PROJECTION_READ_WORKERS
+        )
+        for table in tables:
+            if table is not None:
+                yield table
+    
+    def read_projection(
+        self, dataset_id: str, year: int, month: int, columns: Optional[list[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read the projections of every series for a month as one DataFrame.
+        
+        Tables are concatenated as Arrow tables and converted to pandas once.
+        
+        Args:
+            dataset_id: Dataset ID
+            year: Year
+            month: Month
+            columns: Columns to decode (all if None)
+            
+        Returns:
+            Combined DataFrame, or None if the month has no projections
+        """
+        tables = list(self.iter_projection_tables(dataset_id, year, month, columns))
+        if not tables:
+            return None
+        # concat_tables only chains the column chunks; missing columns are filled with nulls
+        combined = pa.concat_tables(tables, promote_options="default")
+        return combined.to_pandas(self_destruct=True)
+    
     def write_series_projection(
         self, dataset_id: str, series_code: str, year: int, month: int, df: pd.DataFrame
     ) -> None:
         """Write series projection."""
         key = self.paths.projection_series_key(dataset_id, series_code, year, month)
-        self._write_parquet(key, df)
+        self._write_projection_parquet(key, df)
     
-    def write_series_projection_temp(
-        self, dataset_id: str, series_code: str, year: int, month: int, df: pd.DataFrame
-    ) -> None:
-        """Write series projection to temporary location (WAL)."""
-        key = self.paths.projection_series_temp_key(dataset_id, series_code, year, month)
-        self._write_parquet(key, df)
-    
-    def move_series_projection_from_temp(
-        self, dataset_id: str, series_code: str, year: int, month: int
-    ) -> None:
-        """Move series projection from temporary to final location (atomic)."""
-        temp_key = self.paths.projection_series_temp_key(dataset_id, series_code, year, month)
-        final_key = self.paths.projection_series_key(dataset_id, series_code, year, month)
-        
-        # Copy from temp to final
-        body = self.s3.get_object(temp_key)
-        self.s3.put_object(final_key, body, content_type="application/x-parquet")
-        
-        # Delete temp
-        try:
-            self.s3.s3_client.delete_object(Bucket=self.s3.bucket, Key=temp_key)
-        except Exception:
-            pass  # Ignore if temp doesn't exist or any error
-    
-    def cleanup_temp_projections(self, dataset_id: str, year: int, month: int) -> None:
-        """Clean up temporary projections for a month."""
-        prefix = f"datasets/{dataset_id}/projections/windows/"
-        all_keys = self.s3.list_objects(prefix)
-        temp_keys = [
-            key for key in all_keys
-            if f"year={year}/month={month:02d}/.tmp/" in key
-        ]
-        
-        for key in temp_keys:
-            try:
-                self.s3.s3_client.delete_object(Bucket=self.s3.bucket, Key=key)
-            except ClientError:
-                pass
+    def _write_projection_parquet(self, key: str, df: pd.DataFrame) -> None:
+        """Write a projection shard with settings tuned for small files."""
+        write_options = {**PROJECTION_PARQUET_OPTIONS, "row_group_size": max(1, len(df))}
+        self._write_parquet(key, df, write_options=write_options)
     
     def read_consolidation_manifest(self, dataset_id: str, year: int, month: int) -> Optional[dict]:
         """Read consolidation manifest."""
@@ -80,4 +116,33 @@ class S3ProjectionStore(S3BaseStore):
             "timestamp": self.clock.now_iso(),
         }
         self._write_json(key, manifest)
-
+    
+    def mark_consolidation_pending(self, dataset_id: str, year: int, month: int) -> None:
+        """Write the marker of a month whose consolidation has started."""
+        key = self.paths.consolidation_pending_key(dataset_id, year, month)
+        self.s3.put_object(key, b"")
+    
+    def clear_consolidation_pending(self, dataset_id: str, year: int, month: int) -> None:
+        """Remove the pending consolidation marker of a month."""
+        key = self.paths.consolidation_pending_key(dataset_id, year, month)
+        self.s3.delete_object(key)
+    
+    def list_pending_consolidations(self, dataset_id: str) -> list[tuple[int, int]]:
+        """
+        List months whose consolidation was started but never completed.
+        
+        Markers live under their own prefix, so this is a single LIST that
+        is empty in the common case.
+        
+        Args:
+            dataset_id: Dataset ID
+            
+        Returns:
+            Sorted list of (year, month) tuples
+        """
+        prefix = self.paths.consolidation_pending_prefix(dataset_id)
+        months = []
+        for key in self.s3.iter_objects(prefix):
+            year, month = key[len(prefix):].split("-")
+            months.append((int(year), int(month)))
+        return sorted(months)
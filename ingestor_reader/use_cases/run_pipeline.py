@@ -1,5 +1,6 @@
 """Pipeline orchestrator."""
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 import pandas as pd
 
@@ -13,7 +14,7 @@ from ingestor_reader.infra.s3_catalog import S3Catalog
 from ingestor_reader.infra.event_bus.sns_publisher import SNSPublisher
 from ingestor_reader.infra.locks import DynamoDBLock
 from ingestor_reader.infra.common import get_logger
-from ingestor_reader.use_cases.steps.fetch_resource import fetch_resource, compute_file_hash
+from ingestor_reader.use_cases.steps.fetch_resource import fetch_resource_with_hash
 from ingestor_reader.use_cases.steps.check_source_changed import check_source_changed
 from ingestor_reader.use_cases.steps.parse_file import parse_file
 from ingestor_reader.use_cases.steps.filter_new_data import filter_new_data
@@ -27,6 +28,8 @@ from ingestor_reader.use_cases.steps.notify_consumers import notify_consumers
 
 logger = get_logger(__name__)
 
+PREFETCH_WORKERS = 2
+
 
 def _get_lock_manager(app_config: AppConfig) -> DynamoDBLock | None:
     """
@@ -42,6 +45,7 @@ def _get_lock_manager(app_config: AppConfig) -> DynamoDBLock | None:
         return DynamoDBLock(
             table_name=app_config.dynamodb_lock_table,
             region=app_config.aws_region,
+            consistent_read=True,
         )
     return None
 
@@ -49,7 +53,7 @@ def _get_lock_manager(app_config: AppConfig) -> DynamoDBLock | None:
 def _initialize_infrastructure(app_config: AppConfig) -> tuple[S3Catalog, SNSPublisher, DynamoDBLock | None]:
     """Initialize infrastructure adapters."""
     s3_storage = S3Storage(bucket=app_config.s3_bucket, region=app_config.aws_region)
-    catalog = S3Catalog(s3_storage)
+    catalog = S3Catalog(s3_storage, memoize_manifests=True, memoize_index=True)
     publisher = SNSPublisher(region=app_config.aws_region)
     lock_manager = _get_lock_manager(app_config)
     
@@ -95,36 +99,52 @@ def run_pipeline(
             logger.warning("Pipeline already running for %s, skipping execution", config.dataset_id)
             return run
     
+    # S3 reads are prefetched so their latency overlaps the download and processing
+    prefetch = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
     try:
-        # Verify pointer-index consistency and rebuild if needed
-        if not catalog.verify_pointer_index_consistency(config.dataset_id):
-            logger.warning("Pointer-index inconsistency detected, rebuilding index...")
-            catalog.rebuild_index_from_pointer(config.dataset_id)
-            logger.info("Index rebuilt successfully")
+        consistency_future = prefetch.submit(
+            catalog.verify_pointer_index_consistency, config.dataset_id
+        )
 
         content, file_hash, file_size = step_fetch_resource(
             config, app_config
         )
         
+        # Verify pointer-index consistency and rebuild if needed
+        if not consistency_future.result():
+            logger.warning("Pointer-index inconsistency detected, rebuilding index...")
+            catalog.rebuild_index_from_pointer(config.dataset_id)
+            logger.info("Index rebuilt successfully")
+        
 
-        if not step_check_source_changed(catalog, config.dataset_id, content, full_reload):
+        if not step_check_source_changed(
+            catalog, config.dataset_id, content, full_reload, file_hash=file_hash
+        ):
             logger.info("Pipeline completed: no changes detected")
             return run
         
-
+        # Intermediate frames are released as soon as the next step has consumed
+        # them, so only the delta-sized data is held during writes and consolidation
         parsed_df = step_parse_file(content, config)
+        del content
         
 
         new_df = step_filter_new_data(catalog, config.dataset_id, parsed_df)
+        del parsed_df
         if len(new_df) == 0:
             logger.info("Pipeline completed: no new data")
             return run
         
+        # Only read once there are rows to diff; the download overlaps normalization
+        index_future = prefetch.submit(catalog.read_index, config.dataset_id)
 
         normalized_df = step_normalize_rows(new_df, config)
+        del new_df
         
 
-        delta_df, current_index_df = step_compute_delta(catalog, config, normalized_df)
+        delta_df, current_index_df = step_compute_delta(
+            catalog, config, normalized_df, index_future
+        )
         
 
         enriched_delta_df = step_enrich_metadata(delta_df, config, version_ts)
@@ -158,6 +178,8 @@ def run_pipeline(
         
         return run
     finally:
+        # Prefetches are read-only, so an early return or error doesn't wait for them
+        prefetch.shutdown(wait=False, cancel_futures=True)
 
         if lock_manager and lock_acquired:
             lock_manager.release(lock_key, run_id)
@@ -171,8 +193,9 @@ def step_fetch_resource(
     if not config.source.url:
         raise ValueError("URL required in source config")
     
-    content = fetch_resource(config.source.url, verify_ssl=app_config.verify_ssl)
-    file_hash = compute_file_hash(content)
+    content, file_hash = fetch_resource_with_hash(
+        config.source.url, verify_ssl=app_config.verify_ssl
+    )
     file_size = len(content)
     
     logger.info("Fetched %d bytes, hash=%s", file_size, file_hash[:8])
@@ -185,13 +208,14 @@ def step_check_source_changed(
     dataset_id: str,
     content: bytes,
     full_reload: bool,
+    file_hash: Optional[str] = None,
 ) -> bool:
-    """Step: Check if source file changed."""
+    """Step: Check if source file changed (reusing the fetch step's hash if given)."""
     if full_reload:
         logger.info("Full reload requested, processing regardless of source changes")
         return True
     
-    has_changed, _ = check_source_changed(catalog, dataset_id, content)
+    has_changed, _ = check_source_changed(catalog, dataset_id, content, current_hash=file_hash)
     if not has_changed:
         logger.info("Source unchanged, skipping processing")
     return has_changed
@@ -214,10 +238,11 @@ def step_filter_new_data(
 ) -> pd.DataFrame:
     """Step: Filter parsed data to only include new rows (by date)."""
     new_df = filter_new_data(catalog, dataset_id, parsed_df)
-    if len(new_df) == 0:
+    n_rows = len(new_df)
+    if n_rows == 0:
         logger.info("No new data to process")
     else:
-        logger.info("Filtered to %d new rows", len(new_df))
+        logger.info("Filtered to %d new rows", n_rows)
     return new_df
 
 
@@ -235,9 +260,13 @@ def step_compute_delta(
     catalog: S3Catalog,
     config: DatasetConfig,
     normalized_df: pd.DataFrame,
+    index_future: Optional[Future] = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame | None]:
-    """Step: Compute which rows are new (delta)."""
-    current_index_df = catalog.read_index(config.dataset_id)
+    """Step: Compute which rows are new (delta), using a prefetched index if given."""
+    if index_future is not None:
+        current_index_df = index_future.result()
+    else:
+        current_index_df = catalog.read_index(config.dataset_id)
     delta_df = compute_delta_step(
         normalized_df, current_index_df, config.normalize.primary_keys
     )
@@ -252,10 +281,10 @@ def step_enrich_metadata(
 ) -> pd.DataFrame:
     """Step: Enrich delta with metadata."""
     if len(delta_df) == 0:
-        return delta_df.copy()
+        return delta_df
     
 
-    delta_without_hash = delta_df.drop(columns=["key_hash"], errors="ignore").copy()
+    delta_without_hash = delta_df.drop(columns=["key_hash"], errors="ignore")
     enriched_delta_df = enrich_metadata(delta_without_hash, config, version_ts)
     logger.info("Enriched %d rows with metadata", len(enriched_delta_df))
     return enriched_delta_df
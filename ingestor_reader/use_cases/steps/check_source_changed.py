@@ -12,6 +12,7 @@ def check_source_changed(
     catalog: S3Catalog,
     dataset_id: str,
     source_content: bytes,
+    current_hash: Optional[str] = None,
 ) -> tuple[bool, Optional[str]]:
     """
     Check if source file changed compared to last processed version.
@@ -20,6 +21,7 @@ def check_source_changed(
         catalog: S3 catalog instance
         dataset_id: Dataset ID
         source_content: Source file content bytes
+        current_hash: SHA256 of source_content if already computed (skips rehashing)
         
     Returns:
         Tuple of (has_changed: bool, last_hash: Optional[str])
@@ -27,7 +29,8 @@ def check_source_changed(
         - last_hash: Hash of last processed file (None if first run)
     """
 
-    current_hash = compute_file_hash(source_content)
+    if current_hash is None:
+        current_hash = compute_file_hash(source_content)
     
 
     current_manifest = catalog.read_current_manifest(dataset_id)
@@ -28,13 +28,32 @@ class ConsolidationManifest:
         manifest = self.catalog.read_consolidation_manifest(dataset_id, year, month)
         return manifest is not None and manifest.get("status") == "completed"
     
+    def get_pending_months(self, dataset_id: str) -> list[tuple[int, int]]:
+        """
+        Get months left in_progress by a failed or interrupted consolidation.
+        
+        Args:
+            dataset_id: Dataset ID
+            
+        Returns:
+            Sorted list of (year, month) tuples
+        """
+        return self.catalog.list_pending_consolidations(dataset_id)
+    
     def mark_in_progress(self, dataset_id: str, year: int, month: int) -> None:
-        """Mark consolidation as in progress."""
+        """Mark consolidation as in progress (and pending until completed)."""
+        # The marker goes first, so every in_progress month can be found again
+        self.catalog.mark_consolidation_pending(dataset_id, year, month)
         self.catalog.write_consolidation_manifest(dataset_id, year, month, status="in_progress")
         logger.debug("Marked consolidation as in_progress for %d-%02d", year, month)
     
     def mark_completed(self, dataset_id: str, year: int, month: int) -> None:
         """Mark consolidation as completed."""
         self.catalog.write_consolidation_manifest(dataset_id, year, month, status="completed")
+        self.clear_pending(dataset_id, year, month)
         logger.debug("Marked consolidation as completed for %d-%02d", year, month)
+    
+    def clear_pending(self, dataset_id: str, year: int, month: int) -> None:
+        """Stop retrying a month's consolidation."""
+        self.catalog.clear_consolidation_pending(dataset_id, year, month)
 
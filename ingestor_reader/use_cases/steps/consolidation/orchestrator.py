@@ -1,16 +1,32 @@
 """Consolidation orchestrator."""
+import numpy as np
 import pandas as pd
 from typing import Optional
 
 from ingestor_reader.infra.s3_catalog import S3Catalog
+from ingestor_reader.infra.s3_storage import S3_MAX_POOL_CONNECTIONS
 from ingestor_reader.domain.entities.dataset_config import DatasetConfig
 from ingestor_reader.domain.services.consolidation_service import consolidate_month_projections
-from ingestor_reader.infra.common import get_logger, find_date_column, add_year_month_partitions
+from ingestor_reader.infra.common import (
+    get_logger,
+    find_date_column,
+    add_year_month_partitions,
+    as_datetime,
+    run_concurrently,
+)
 from ingestor_reader.use_cases.steps.consolidation.manifest import ConsolidationManifest
 from ingestor_reader.use_cases.steps.consolidation.writer import ConsolidationWriter
 
 logger = get_logger(__name__)
 
+# Each worker holds a whole month of events in memory and fans out its own
+# projection writes, so month-level concurrency is kept small
+MONTH_WORKERS = 4
+
+# Months share one S3 client, so each month's event reads and projection
+# writes get an equal share of its connection pool instead of queueing on it
+S3_WORKERS_PER_MONTH = S3_MAX_POOL_CONNECTIONS // MONTH_WORKERS
+
 
 class ConsolidationOrchestrator:
     """Orchestrates consolidation of events into projection windows."""
@@ -30,45 +46,97 @@ class ConsolidationOrchestrator:
         Consolidate events into projection windows.
         
         For each year/month affected by the delta, consolidates all events
-        into a projection window.
+        into a projection window. Months left in_progress by an earlier failed
+        or interrupted run are regenerated from events as well.
         
         Args:
             config: Dataset configuration
             enriched_delta_df: Enriched delta DataFrame
         """
-        if len(enriched_delta_df) == 0:
-            return
-        
-        date_col = find_date_column(enriched_delta_df)
-        if date_col is None:
-            logger.warning("No date column found, skipping consolidation")
-            return
-        
-        if "internal_series_code" not in enriched_delta_df.columns:
-            logger.warning("No internal_series_code column found, skipping consolidation")
-            return
-        
-        df_with_partitions = add_year_month_partitions(enriched_delta_df, date_col, drop_invalid=True)
-        affected_months = self._get_affected_months(df_with_partitions)
-        
-        if not affected_months:
+        affected_months = self._get_delta_months(enriched_delta_df)
+        
+        pending_months = [
+            year_month for year_month in self.manifest.get_pending_months(config.dataset_id)
+            if year_month not in affected_months
+        ]
+        if pending_months:
+            logger.warning("Retrying consolidation for %d month(s) left in_progress", 
+                           len(pending_months))
+        
+        months = sorted(affected_months + pending_months)
+        if not months:
             logger.info("No valid months found, skipping consolidation")
             return
         
-        logger.info("Consolidating projections for %d affected month(s)", len(affected_months))
+        logger.info("Consolidating projections for %d affected month(s)", len(months))
         
-        # Convert to set for fast lookup
-        affected_months_set = set(affected_months)
-        
-        for year, month in affected_months:
+        # Months touch disjoint keys, so they are consolidated concurrently. A
+        # failed month is logged, doesn't stop the others, and stays pending
+        # so the next consolidation retries it. Pending months may hold a mix
+        # of old and new projections, so they are regenerated regardless of
+        # their manifest
+        def consolidate_month(year_month: tuple[int, int]) -> None:
+            year, month = year_month
             try:
                 self._consolidate_month(
-                    config, year, month, config.normalize.primary_keys,
-                    affected_months=affected_months_set
+                    config, year, month, config.normalize.primary_keys, has_new_data=True
                 )
             except Exception as e:
                 logger.error("Failed to consolidate projections for %d-%02d: %s", 
                            year, month, e)
+        
+        run_concurrently(consolidate_month, months, max_workers=MONTH_WORKERS)
+    
+    def _get_delta_months(self, enriched_delta_df: pd.DataFrame) -> list[tuple[int, int]]:
+        """
+        Get the (year, month) tuples touched by the delta.
+        
+        Args:
+            enriched_delta_df: Enriched delta DataFrame
+            
+        Returns:
+            List of (year, month) tuples, sorted (empty if the delta can't be
+            consolidated)
+        """
+        if len(enriched_delta_df) == 0:
+            return []
+        
+        date_col = find_date_column(enriched_delta_df)
+        if date_col is None:
+            logger.warning("No date column found, skipping consolidation of the delta")
+            return []
+        
+        if "internal_series_code" not in enriched_delta_df.columns:
+            logger.warning("No internal_series_code column found, skipping consolidation of the delta")
+            return []
+        
+        affected_months = self._get_single_affected_month(enriched_delta_df[date_col])
+        if affected_months is None:
+            df_with_partitions = add_year_month_partitions(enriched_delta_df, date_col, drop_invalid=True)
+            affected_months = self._get_affected_months(df_with_partitions)
+        return affected_months
+    
+    def _get_single_affected_month(self, dates: pd.Series) -> Optional[list[tuple[int, int]]]:
+        """
+        Get the affected month when all dates fall in the same month.
+        
+        Daily deltas usually cover a single month; comparing the min and max
+        dates detects that without building year/month partition columns.
+        
+        Args:
+            dates: Date column of the delta
+            
+        Returns:
+            List with the single (year, month) (empty if no valid dates),
+            or None if the dates span several months
+        """
+        parsed = as_datetime(dates)
+        first, last = parsed.min(), parsed.max()
+        if pd.isna(first):
+            return []
+        if (first.year, first.month) != (last.year, last.month):
+            return None
+        return [(int(first.year), int(first.month))]
     
     def _get_affected_months(self, df: pd.DataFrame) -> list[tuple[int, int]]:
         """
@@ -80,9 +148,11 @@ class ConsolidationOrchestrator:
         Returns:
             List of (year, month) tuples, sorted by year and month
         """
-        months = df[["year", "month"]].drop_duplicates()
-        result = [(int(row["year"]), int(row["month"])) for _, row in months.iterrows()]
-        return sorted(result, key=lambda x: (x[0], x[1]))
+        # Pack (year, month) into one integer so np.unique dedupes and sorts in one pass
+        packed = np.unique(
+            df["year"].to_numpy(dtype=np.int64) * 100 + df["month"].to_numpy(dtype=np.int64)
+        )
+        return [divmod(value, 100) for value in packed.tolist()]
     
     def _consolidate_month(
         self,
@@ -90,29 +160,27 @@ class ConsolidationOrchestrator:
         year: int,
         month: int,
         primary_keys: list[str],
-        affected_months: set[tuple[int, int]] | None = None,
+        has_new_data: bool = False,
     ) -> None:
         """
         Consolidate projections for a specific month with restart resilience.
         
-        Uses manifest for idempotency and WAL pattern for atomic writes.
-        Re-consolidates if month has new data (in affected_months).
+        Uses manifest for idempotency and restart recovery.
+        Re-consolidates if month has new data.
         
         Args:
             config: Dataset configuration
             year: Year
             month: Month (1-12)
             primary_keys: Primary key columns
-            affected_months: Set of (year, month) tuples with new data.
-                            If month is in this set, always re-consolidate.
-                            If None, only check manifest (idempotency for restarts).
+            has_new_data: If True, always re-consolidate. If False, only
+                          consolidate when the manifest isn't completed
+                          (idempotency for restarts).
         """
         dataset_id = config.dataset_id
         
         # If month has new data, always re-consolidate (ignore manifest)
         # Otherwise, check manifest for idempotency (restart resilience)
-        has_new_data = affected_months is not None and (year, month) in affected_months
-        
         if not has_new_data:
             # No new data: check manifest for idempotency (restart resilience)
             if self.manifest.is_already_consolidated(dataset_id, year, month):
@@ -122,24 +190,26 @@ class ConsolidationOrchestrator:
             # Has new data: always re-consolidate (ignore manifest)
             logger.info("Re-consolidating %d-%02d (has new data)", year, month)
         
-        # Clean up any leftover temp files
-        self.writer.cleanup_temp(dataset_id, year, month)
-        
         # Mark as in progress
         self.manifest.mark_in_progress(dataset_id, year, month)
         
         try:
             # Consolidate all events for the month
             series_projections = consolidate_month_projections(
-                self.catalog, dataset_id, year, month, primary_keys
+                self.catalog, dataset_id, year, month, primary_keys,
+                max_workers=S3_WORKERS_PER_MONTH,
             )
             
             if not series_projections:
                 logger.warning("No series projections to write for %d-%02d", year, month)
+                # No events to regenerate from, so retrying wouldn't help
+                self.manifest.clear_pending(dataset_id, year, month)
                 return
             
-            # Write all projections using WAL pattern (temp -> final)
-            self.writer.write_series_projections(dataset_id, year, month, series_projections)
+            # Write all projections to their final location
+            self.writer.write_series_projections(
+                dataset_id, year, month, series_projections, max_workers=S3_WORKERS_PER_MONTH
+            )
             
             # Mark as completed
             self.manifest.mark_completed(dataset_id, year, month)
@@ -148,6 +218,5 @@ class ConsolidationOrchestrator:
             
         except Exception as e:
             logger.error("Failed to consolidate %d-%02d: %s", year, month, e)
-            self.writer.cleanup_temp(dataset_id, year, month)
             raise
 
@@ -1,13 +1,15 @@
-"""Consolidation writer with WAL pattern."""
+"""Consolidation writer for series projections."""
 import pandas as pd
 from ingestor_reader.infra.s3_catalog import S3Catalog
-from ingestor_reader.infra.common import get_logger
+from ingestor_reader.infra.common import get_logger, run_concurrently
 
 logger = get_logger(__name__)
 
+PROJECTION_WRITE_WORKERS = 32
+
 
 class ConsolidationWriter:
-    """Writes series projections using WAL pattern for atomic operations."""
+    """Writes series projections for a consolidated month."""
     
     def __init__(self, catalog: S3Catalog):
         """Initialize consolidation writer."""
@@ -19,37 +21,34 @@ class ConsolidationWriter:
         year: int,
         month: int,
         series_projections: dict[str, pd.DataFrame],
+        max_workers: int = PROJECTION_WRITE_WORKERS,
     ) -> None:
         """
-        Write all series projections for a month using WAL pattern.
+        Write all series projections for a month directly to their final keys.
         
-        Writes to temporary location first, then moves atomically to final location.
+        Each projection is a single PUT (atomic per object), issued concurrently
+        across series. A failure part-way leaves the month pending (see
+        ConsolidationManifest), so the next consolidation regenerates it from
+        events.
         
         Args:
             dataset_id: Dataset ID
             year: Year
             month: Month (1-12)
             series_projections: Dict mapping series_code to consolidated DataFrame
+            max_workers: Maximum concurrent projection writes
             
         Raises:
-            Exception: If any write or move operation fails
+            Exception: If any write operation fails
         """
-        # Write all projections to temporary location
-        for series_code, consolidated_df in series_projections.items():
-            self.catalog.write_series_projection_temp(
+        def write_final(item: tuple[str, pd.DataFrame]) -> None:
+            series_code, consolidated_df = item
+            self.catalog.write_series_projection(
                 dataset_id, series_code, year, month, consolidated_df
             )
-            logger.debug("Written temp projection for %s %d-%02d (%d rows)", 
+            logger.info("Written projection for %s %d-%02d (%d rows)", 
                        series_code, year, month, len(consolidated_df))
         
-        # Move all projections atomically from temp to final
-        for series_code in series_projections.keys():
-            self.catalog.move_series_projection_from_temp(dataset_id, series_code, year, month)
-            logger.info("Moved projection for %s %d-%02d to final location", 
-                       series_code, year, month)
-    
-    def cleanup_temp(self, dataset_id: str, year: int, month: int) -> None:
-        """Clean up temporary projections for a month."""
-        self.catalog.cleanup_temp_projections(dataset_id, year, month)
-        logger.debug("Cleaned up temp projections for %d-%02d", year, month)
-
+        run_concurrently(
+            write_final, series_projections.items(), max_workers=max_workers
+        )
@@ -1,54 +1,94 @@
 """Enrich metadata step."""
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from ingestor_reader.domain.entities.dataset_config import DatasetConfig
-from ingestor_reader.infra.common import get_logger, get_clock
+from ingestor_reader.infra.common import get_logger, get_clock, as_datetime
 from ingestor_reader.infra.common.series import resolve_series_code
 
 logger = get_logger(__name__)
 
+# Same as the default `str` dtype on pandas 3 (NaN as missing value); the
+# na_value argument needs pandas >= 2.3
+ARROW_STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
 
-def _add_dataset_metadata(df: pd.DataFrame, config: DatasetConfig) -> None:
-    """Add dataset_id and provider columns."""
-    df["dataset_id"] = config.dataset_id
-    df["provider"] = config.provider or ""
 
+def _dataset_metadata(config: DatasetConfig) -> dict:
+    """Get dataset_id and provider columns."""
+    return {"dataset_id": config.dataset_id, "provider": config.provider or ""}
 
-def _add_frequency_and_unit(df: pd.DataFrame, config: DatasetConfig) -> None:
-    """Add frequency and unit, using DataFrame values if present, otherwise config."""
+
+def _frequency_and_unit(df: pd.DataFrame, config: DatasetConfig) -> dict:
+    """Get frequency and unit from config, for those missing in the DataFrame."""
+    columns = {}
     if "frequency" not in df.columns:
-        df["frequency"] = config.frequency
+        columns["frequency"] = config.frequency
     if "unit" not in df.columns:
-        df["unit"] = config.unit or ""
+        columns["unit"] = config.unit or ""
+    return columns
 
 
-def _add_source_kind(df: pd.DataFrame, config: DatasetConfig) -> None:
-    """Add source_kind: FILE if source has file format, otherwise based on source.kind."""
+def _source_kind(config: DatasetConfig) -> dict:
+    """Get source_kind: FILE if source has file format, otherwise based on source.kind."""
     if config.source.format:
-        df["source_kind"] = "FILE"
-    else:
-        source_kind_map = {"http": "API", "local": "FILE"}
-        df["source_kind"] = source_kind_map.get(config.source.kind, "FILE")
+        return {"source_kind": "FILE"}
+    source_kind_map = {"http": "API", "local": "FILE"}
+    return {"source_kind": source_kind_map.get(config.source.kind, "FILE")}
 
 
-def _add_obs_date(df: pd.DataFrame) -> None:
-    """Derive obs_date from obs_time (local date without time)."""
-    if "obs_time" in df.columns:
-        df["obs_date"] = pd.to_datetime(df["obs_time"]).dt.date
-    else:
-        df["obs_date"] = None
+def _obs_date(df: pd.DataFrame) -> dict:
+    """
+    Derive obs_date from obs_time (local date without time).
+    
+    Dates are truncated with datetime64[D] arithmetic into an Arrow date32
+    column, avoiding one boxed datetime.date per row; Parquet stores the
+    same DATE type as before.
+    """
+    if "obs_time" not in df.columns:
+        return {"obs_date": None}
+    
+    obs_time = as_datetime(df["obs_time"], errors="raise")
+    if isinstance(obs_time.dtype, pd.DatetimeTZDtype):
+        obs_time = obs_time.dt.tz_localize(None)
+    days = obs_time.to_numpy().astype("datetime64[D]")
+    obs_date = pa.array(days, type=pa.date32(), from_pandas=True)
+    return {"obs_date": pd.array(obs_date, dtype=pd.ArrowDtype(pa.date32()))}
 
 
-def _add_version_metadata(df: pd.DataFrame, version_ts: str) -> None:
-    """Add version and vintage_date columns."""
+def _version_metadata(version_ts: str) -> dict:
+    """Get version and vintage_date columns."""
     clock = get_clock()
-    df["version"] = version_ts
-    df["vintage_date"] = clock.now()
+    return {"version": version_ts, "vintage_date": clock.now()}
 
 
-def _add_quality_flag(df: pd.DataFrame) -> None:
-    """Add quality_flag column with default value 'OK'."""
-    df["quality_flag"] = "OK"
+def _quality_flag() -> dict:
+    """Get quality_flag column with default value 'OK'."""
+    return {"quality_flag": "OK"}
+
+
+def _to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast object columns holding strings to the Arrow-backed string dtype.
+    
+    Arrow strings are packed into contiguous buffers instead of one Python
+    object per value, and convert to Parquet without a per-value pass.
+    Columns that already use a string dtype are left untouched.
+    
+    Args:
+        df: DataFrame to convert
+        
+    Returns:
+        DataFrame with string object columns cast
+    """
+    string_columns = {
+        col: ARROW_STRING_DTYPE
+        for col in df.columns
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == "string"
+    }
+    if not string_columns:
+        return df
+    return df.astype(string_columns)
 
 
 def _reorder_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -101,19 +141,21 @@ def enrich_metadata(
     """
     logger.info("Enriching %d rows with metadata", len(df))
     
-    df = df.copy()
-    
     # Resolve series_code (add if missing)
     df = resolve_series_code(df, config)
     
-    _add_dataset_metadata(df, config)
-    _add_frequency_and_unit(df, config)
-    _add_source_kind(df, config)
-    _add_obs_date(df)
-    _add_version_metadata(df, version_ts)
-    _add_quality_flag(df)
+    # New columns are added in one assign, which shares the existing columns
+    # instead of copying the whole frame
+    df = df.assign(
+        **_dataset_metadata(config),
+        **_frequency_and_unit(df, config),
+        **_source_kind(config),
+        **_obs_date(df),
+        **_version_metadata(version_ts),
+        **_quality_flag(),
+    )
     
-    result = _reorder_columns(df)
+    result = _reorder_columns(_to_arrow_strings(df))
     
     logger.info("Enriched %d rows with metadata", len(result))
     return result
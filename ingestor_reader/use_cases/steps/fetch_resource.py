@@ -1,17 +1,52 @@
 """Fetch resource step."""
 import os
-import requests
+from functools import lru_cache
 from pathlib import Path
 
-from ingestor_reader.infra.common import get_logger, compute_file_hash
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ingestor_reader.infra.common import get_logger, compute_file_hash, new_file_hasher
 
 logger = get_logger(__name__)
 
+FETCH_CHUNK_SIZE = 1 << 20
+HTTP_POOL_SIZE = 16
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+)
 
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Get the shared HTTP session.
+    
+    Reusing one session keeps connections (and their TLS sessions) alive
+    across fetches and warm invocations; transient errors are retried.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
 def _get_cert_path() -> str | None:
     """
     Get path to custom certificate bundle if available.
     
+    Resolved once per process: the bundle location doesn't change while
+    the process runs, so later fetches skip the filesystem checks.
+    
     Returns:
         Path to certificate bundle or None if not found
     """
@@ -28,35 +63,65 @@ def _get_cert_path() -> str | None:
     return None
 
 
-def fetch_resource(url: str, verify_ssl: bool = True) -> bytes:
+def _resolve_verify(verify_ssl: bool) -> bool | str:
     """
-    Fetch resource from HTTP URL.
+    Resolve the requests `verify` argument.
     
     Args:
-        url: HTTP URL
         verify_ssl: Whether to verify SSL certificates
         
     Returns:
-        Content bytes
+        Certificate bundle path, True, or False
     """
-    logger.info("Fetching from HTTP: %s (verify_ssl=%s)", url, verify_ssl)
-    
-
     if verify_ssl:
         cert_path = _get_cert_path()
         if cert_path:
             logger.info("Using custom certificate bundle: %s", cert_path)
-            verify = cert_path
-        else:
-            verify = True
-    else:
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-        verify = False
+            return cert_path
+        return True
     
-    response = requests.get(url, timeout=300, verify=verify)
-    response.raise_for_status()
-    return response.content
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return False
 
 
+def fetch_resource_with_hash(url: str, verify_ssl: bool = True) -> tuple[bytes, str]:
+    """
+    Fetch resource from HTTP URL, hashing it while it downloads.
+    
+    The body is streamed in chunks that are hashed as they arrive, so the
+    hash doesn't need a second pass over the content after the download.
+    
+    Args:
+        url: HTTP URL
+        verify_ssl: Whether to verify SSL certificates
+        
+    Returns:
+        Tuple of (content bytes, SHA256 hash as hex string)
+    """
+    logger.info("Fetching from HTTP: %s (verify_ssl=%s)", url, verify_ssl)
+    verify = _resolve_verify(verify_ssl)
+    
+    hasher = new_file_hasher()
+    chunks = []
+    with get_http_session().get(url, timeout=300, verify=verify, stream=True) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+            hasher.update(chunk)
+            chunks.append(chunk)
+    
+    return b"".join(chunks), hasher.hexdigest()
 
+
+def fetch_resource(url: str, verify_ssl: bool = True) -> bytes:
+    """
+    Fetch resource from HTTP URL.
+    
+    Args:
+        url: HTTP URL
+        verify_ssl: Whether to verify SSL certificates
+        
+    Returns:
+        Content bytes
+    """
+    content, _ = fetch_resource_with_hash(url, verify_ssl=verify_ssl)
+    return content
@@ -1,25 +1,135 @@
 """Filter new data by date step."""
+import threading
+from collections import OrderedDict
 from typing import Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from ingestor_reader.infra.s3_catalog import S3Catalog
-from ingestor_reader.infra.common import get_logger, find_date_column
+from ingestor_reader.infra.common import get_logger, as_datetime, prefetch_map
 
 logger = get_logger(__name__)
 
+MAX_DATE_CACHE_SIZE = 512
+MAX_DATE_READ_WORKERS = 16
+
+# Bytes fetched from the end of an event file; enough for the footer of the
+# small, few-column event files
+PARQUET_FOOTER_READ_SIZE = 64 * 1024
+
+# Same lookup order as find_date_column
+DATE_COLUMNS = ("obs_time", "obs_date")
+
+# Event files are immutable (each version writes new keys), so the max date
+# of a file can be reused across runs in the same process without revalidation
+_max_date_cache: OrderedDict[tuple[str, str], pd.Timestamp] = OrderedDict()
+_max_date_cache_lock = threading.Lock()
+
+
+def clear_max_date_cache() -> None:
+    """Drop all cached per-file max dates."""
+    with _max_date_cache_lock:
+        _max_date_cache.clear()
+
 
 def _get_max_date_from_file(catalog: S3Catalog, file_key: str) -> Optional[pd.Timestamp]:
-    """Get maximum date from a single output file."""
+    """Get maximum date from a single output file (cached per bucket and key)."""
+    cache_key = (catalog.s3.bucket, file_key)
+    with _max_date_cache_lock:
+        if cache_key in _max_date_cache:
+            _max_date_cache.move_to_end(cache_key)
+            return _max_date_cache[cache_key]
+    
+    max_date = _read_max_date_from_file(catalog, file_key)
+    if max_date is not None:
+        with _max_date_cache_lock:
+            _max_date_cache[cache_key] = max_date
+            _max_date_cache.move_to_end(cache_key)
+            if len(_max_date_cache) > MAX_DATE_CACHE_SIZE:
+                _max_date_cache.popitem(last=False)
+    return max_date
+
+
+def _find_date_field(schema: pa.Schema) -> Optional[str]:
+    """Find the date column in a Parquet file's schema (same lookup as find_date_column)."""
+    return next((col for col in DATE_COLUMNS if col in schema.names), None)
+
+
+def _max_date_from_statistics(parquet_file: pq.ParquetFile) -> Optional[pd.Timestamp]:
+    """
+    Get the maximum date from Parquet row group statistics.
+    
+    Args:
+        parquet_file: Parquet file (footer metadata is enough)
+        
+    Returns:
+        Maximum date, or None if the date column is missing, not a date type,
+        or some row group has no min/max statistics
+    """
+    schema = parquet_file.schema_arrow
+    date_column = _find_date_field(schema)
+    if date_column is None:
+        return None
+    
+    field_type = schema.field(date_column).type
+    if not (pa.types.is_timestamp(field_type) or pa.types.is_date(field_type)):
+        return None
+    
+    metadata = parquet_file.metadata
+    if metadata.num_row_groups == 0:
+        return None
+    column_index = schema.get_field_index(date_column)
+    
+    max_values = []
+    for i in range(metadata.num_row_groups):
+        statistics = metadata.row_group(i).column(column_index).statistics
+        if statistics is None or not statistics.has_min_max:
+            return None
+        max_values.append(pd.Timestamp(statistics.max))
+    
+    max_date = max(max_values)
+    if pa.types.is_timestamp(field_type) and field_type.tz is not None:
+        # Statistics are in UTC; report the column's own timezone as a full read would
+        max_date = max_date.tz_convert(field_type.tz)
+    return max_date
+
+
+def _read_max_date_from_file(catalog: S3Catalog, file_key: str) -> Optional[pd.Timestamp]:
+    """
+    Read maximum date from a single output file.
+    
+    Only the file's tail is downloaded (plus one more ranged GET if the
+    footer is larger than the tail) and the date column's row group
+    statistics are used; the whole file is downloaded (and its date column
+    read) only when the statistics are missing.
+    """
     try:
+        tail = catalog.s3.get_object_range(file_key, f"bytes=-{PARQUET_FOOTER_READ_SIZE}")
+        parquet_file = catalog.parquet_io.read_metadata_from_tail(tail)
+        footer_size = catalog.parquet_io.footer_size(tail)
+        if parquet_file is None and footer_size is not None and footer_size > len(tail):
+            # Larger footer: its exact size is known now, fetch just that range
+            tail = catalog.s3.get_object_range(file_key, f"bytes=-{footer_size}")
+            parquet_file = catalog.parquet_io.read_metadata_from_tail(tail)
+        if parquet_file is not None:
+            max_date = _max_date_from_statistics(parquet_file)
+            if max_date is not None:
+                return max_date
+        
         parquet_body = catalog.s3.get_object(file_key)
-        df = catalog.parquet_io.read_from_bytes(parquet_body)
+        parquet_file = catalog.parquet_io.read_metadata_from_tail(parquet_body)
+        if parquet_file is None:
+            raise ValueError("not a Parquet file")
         
-        date_column = find_date_column(df)
+        date_column = _find_date_field(parquet_file.schema_arrow)
         if not date_column:
             return None
         
-        df[date_column] = pd.to_datetime(df[date_column])
-        return df[date_column].max()
+        # Only the date column is decoded
+        df = catalog.parquet_io.read_from_bytes(parquet_body, columns=[date_column])
+        return as_datetime(df[date_column], errors="raise").max()
     except (KeyError, ValueError, AttributeError) as e:
         logger.warning("Could not read output file %s: %s", file_key, e)
         return None
@@ -44,13 +154,24 @@ def _get_latest_date_from_events(catalog: S3Catalog, dataset_id: str) -> Optiona
     if manifest is None:
         return None
     
+    # Recorded at publish time; manifests written before that need the file scan
+    max_date = manifest.get("outputs", {}).get("max_date")
+    if max_date:
+        return pd.Timestamp(max_date)
+    
     output_files = manifest.get("outputs", {}).get("files", [])
     if not output_files:
         return None
     
+    # Each lookup is a blocking S3 GET, so files are read concurrently
+    max_dates = prefetch_map(
+        lambda file_key: _get_max_date_from_file(catalog, file_key),
+        output_files,
+        max_workers=min(len(output_files), MAX_DATE_READ_WORKERS),
+    )
+    
     latest_date = None
-    for file_key in output_files:
-        max_date = _get_max_date_from_file(catalog, file_key)
+    for max_date in max_dates:
         if max_date is not None:
             if latest_date is None or max_date > latest_date:
                 latest_date = max_date
@@ -58,26 +179,50 @@ def _get_latest_date_from_events(catalog: S3Catalog, dataset_id: str) -> Optiona
     return latest_date
 
 
-def _normalize_timezones(
-    df: pd.DataFrame,
-    date_column: str,
+def _align_timezones(
+    dates: pd.Series,
     cutoff_date: pd.Timestamp,
-) -> tuple[pd.DataFrame, pd.Timestamp]:
-    """Normalize timezones between DataFrame and cutoff date for comparison."""
-    df = df.copy()
-    df[date_column] = pd.to_datetime(df[date_column])
-    
-    df_tz = df[date_column].dt.tz
+) -> tuple[pd.Series, pd.Timestamp]:
+    """Align timezones between a datetime column and the cutoff date, without copying the frame."""
+    # The dtype carries the timezone, no need to build a .dt accessor
+    dates_tz = getattr(dates.dtype, "tz", None)
     cutoff_tz = cutoff_date.tz
+    if dates_tz is None and cutoff_tz is not None:
+        cutoff_date = cutoff_date.tz_localize(None)
+    elif dates_tz is not None and cutoff_tz is None:
+        dates = dates.dt.tz_localize(None)
+    return dates, cutoff_date
+
+
+def _cutoff_in_unit(dates: pd.Series, cutoff: pd.Timestamp) -> int:
+    """
+    Get the cutoff as an int64 epoch value in the column's unit.
     
+    The cutoff is floored: for integer values v, v > c iff v > floor(c).
+    
+    Args:
+        dates: Datetime column (timezone aligned with cutoff)
+        cutoff: Cutoff date
+        
+    Returns:
+        Floored cutoff in the column's unit
+    """
+    unit_ns = int(np.timedelta64(1, dates.dt.unit) / np.timedelta64(1, "ns"))
+    return cutoff.value // unit_ns
 
-    if df_tz is None and cutoff_tz is not None:
-        cutoff_date = cutoff_date.tz_localize(None)
 
-    elif df_tz is not None and cutoff_tz is None:
-        df[date_column] = df[date_column].dt.tz_localize(None)
+def _after_cutoff_mask(dates: pd.Series, cutoff: pd.Timestamp) -> np.ndarray:
+    """
+    Get a boolean mask of dates after the cutoff, compared as int64 epoch values.
     
-    return df, cutoff_date
+    Args:
+        dates: Datetime column (timezone aligned with cutoff)
+        cutoff: Cutoff date
+        
+    Returns:
+        Boolean array (False for NaT)
+    """
+    return dates.array.asi8 > _cutoff_in_unit(dates, cutoff)
 
 
 def filter_new_data(
@@ -111,12 +256,25 @@ def filter_new_data(
         return parsed_df
     
 
-    normalized_df, normalized_cutoff = _normalize_timezones(parsed_df, date_column, latest_date)
+    # Append-only sources are usually all new or all old, which the column's
+    # bounds answer without copying the frame or building a row mask
+    dates, cutoff = _align_timezones(as_datetime(parsed_df[date_column], errors="raise"), latest_date)
+    if not dates.hasnans and dates.min() > cutoff:
+        logger.info("Filtered data: all %d rows are new (after %s)", len(parsed_df), cutoff)
+        return parsed_df
+    if dates.max() <= cutoff:
+        logger.info("Filtered data: all %d rows skipped (not after %s)", len(parsed_df), cutoff)
+        return parsed_df.iloc[0:0]
     
-
-    new_data = normalized_df[normalized_df[date_column] > normalized_cutoff].copy()
+    if not dates.hasnans and dates.is_monotonic_increasing:
+        # Date-sorted input: the new rows are a tail slice found by binary search
+        start = np.searchsorted(dates.array.asi8, _cutoff_in_unit(dates, cutoff), side="right")
+        new_data = parsed_df.iloc[start:]
+    else:
+        # Only the date column is compared; the other columns are sliced, not copied
+        new_data = parsed_df.iloc[np.flatnonzero(_after_cutoff_mask(dates, cutoff))]
     
-    total_rows = len(normalized_df)
+    total_rows = len(parsed_df)
     new_rows = len(new_data)
     skipped_rows = total_rows - new_rows
     
@@ -124,7 +282,7 @@ def filter_new_data(
         "Filtered data: %d rows total, %d new (after %s), %d skipped",
         total_rows,
         new_rows,
-        normalized_cutoff,
+        cutoff,
         skipped_rows,
     )
     
@@ -25,7 +25,7 @@ def normalize_rows(
     plugin_id = getattr(config.normalize, "plugin", None)
     normalizer = get_normalizer(plugin_id)
     
-    logger.info(f"Normalizing with plugin: {normalizer.id}")
+    logger.info("Normalizing with plugin: %s", normalizer.id)
     
     df = normalizer.normalize(config, df)
     
@@ -26,10 +26,10 @@ def parse_file(
     plugin_id = getattr(config, "plugin", None) or getattr(config.parse, "plugin", None)
     parser = get_parser(plugin_id, config)
     
-    logger.info(f"Parsing with plugin: {parser.id}")
+    logger.info("Parsing with plugin: %s", parser.id)
     
     df = parser.parse(config, raw_bytes)
     
-    logger.info(f"Parsed {len(df)} rows, {len(df.columns)} columns")
+    logger.info("Parsed %d rows, %d columns", len(df), len(df.columns))
     return df
 
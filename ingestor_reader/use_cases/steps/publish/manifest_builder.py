@@ -28,6 +28,7 @@ class ManifestBuilder:
         rows_added: int,
         total_rows: int,
         primary_keys: list[str],
+        max_date: str | None = None,
     ) -> Manifest:
         """
         Build manifest for a version.
@@ -40,6 +41,7 @@ class ManifestBuilder:
             rows_added: Number of rows added in this version
             total_rows: Total rows after this version
             primary_keys: Primary key columns
+            max_date: Latest date among this version's rows (ISO format)
             
         Returns:
             Manifest object
@@ -63,6 +65,7 @@ class ManifestBuilder:
                 files=output_keys,
                 rows_total=total_rows,
                 rows_added_this_version=rows_added,
+                max_date=max_date,
             ),
             index=IndexInfo(
                 path=self.paths.index_key(dataset_id),
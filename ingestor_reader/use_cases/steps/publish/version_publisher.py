@@ -5,12 +5,21 @@ import pandas as pd
 from ingestor_reader.infra.s3_catalog import S3Catalog
 from ingestor_reader.domain.entities.manifest import SourceFile
 from ingestor_reader.domain.services.delta_service import update_index
-from ingestor_reader.infra.common import get_logger
+from ingestor_reader.infra.common import get_logger, find_date_column, as_datetime
 from ingestor_reader.use_cases.steps.publish.manifest_builder import ManifestBuilder
 
 logger = get_logger(__name__)
 
 
+def _max_date(df: pd.DataFrame) -> Optional[str]:
+    """Get the latest date in a DataFrame as an ISO string (None if it has no dates)."""
+    date_column = find_date_column(df)
+    if date_column is None:
+        return None
+    max_date = as_datetime(df[date_column]).max()
+    return None if pd.isna(max_date) else max_date.isoformat()
+
+
 class VersionPublisher:
     """Publishes versions atomically using CAS."""
     
@@ -75,6 +84,8 @@ class VersionPublisher:
             rows_added=rows_added,
             total_rows=total_rows,
             primary_keys=primary_keys,
+            # Lets the next run's filter_new_data skip reading the output files
+            max_date=_max_date(delta_df),
         )
         
         # Write event manifest
@@ -28,13 +28,12 @@ def write_events(
     """
     logger.info("Writing events for version %s", version_ts)
     
-
-    if len(enriched_delta_df) > 0:
-        event_keys = catalog.write_events(config.dataset_id, version_ts, enriched_delta_df)
-        total_rows = len(enriched_delta_df)
-    else:
-        event_keys = []
-        total_rows = 0
+    if enriched_delta_df.empty:
+        logger.info("No rows to write")
+        return [], 0
+    
+    event_keys = catalog.write_events(config.dataset_id, version_ts, enriched_delta_df)
+    total_rows = len(enriched_delta_df)
     
     logger.info("Wrote %d event files, %d rows", len(event_keys), total_rows)
     return event_keys, total_rows
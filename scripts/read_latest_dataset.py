@@ -2,7 +2,10 @@
 """Script rápido para leer el último archivo publicado de un dataset."""
 import sys
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
+from typing import Iterator
 
 # Agregar el directorio raíz al path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -14,12 +17,77 @@ from ingestor_reader.infra.parquet_io import ParquetIO
 from ingestor_reader.domain.entities.manifest import Manifest
 
 
+def _write_parquet(tables: Iterator[pa.Table], output_file: str) -> int:
+    """
+    Escribe las tablas a un Parquet a medida que llegan.
+    
+    El esquema del archivo es el de la primera tabla. Si una serie posterior
+    trae un tipo más amplio (ej. una columna toda None en la primera serie y
+    string en otra), el archivo se reescribe una sola vez con el esquema
+    unificado, igual que read_projection.
+    
+    Args:
+        tables: Tablas Arrow (una por serie)
+        output_file: Archivo de salida (.parquet)
+    
+    Returns:
+        Cantidad de filas escritas
+    """
+    writer = None
+    rows = 0
+    try:
+        for table in tables:
+            if writer is None:
+                writer = pq.ParquetWriter(output_file, table.schema, compression="zstd")
+            try:
+                table = table.cast(writer.schema)
+            except (ValueError, pa.ArrowNotImplementedError):
+                # El esquema del writer no puede cambiar: se junta lo escrito con el resto
+                writer.close()
+                writer = None
+                combined = pa.concat_tables(
+                    [pq.read_table(output_file), table, *tables], promote_options="default"
+                )
+                pq.write_table(combined, output_file, compression="zstd")
+                return combined.num_rows
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def _write_tables(tables: Iterator[pa.Table], output_file: str) -> int:
+    """
+    Escribe las tablas al archivo a medida que llegan, sin juntarlas en memoria.
+    
+    Args:
+        tables: Tablas Arrow (una por serie)
+        output_file: Archivo de salida (.parquet; cualquier otro se escribe como CSV)
+    
+    Returns:
+        Cantidad de filas escritas
+    """
+    if output_file.endswith('.parquet'):
+        return _write_parquet(tables, output_file)
+    
+    rows = 0
+    for table in tables:
+        table.to_pandas().to_csv(
+            output_file, mode="a" if rows else "w", header=not rows, index=False
+        )
+        rows += table.num_rows
+    return rows
+
+
 def read_latest_dataset(
     dataset_id: str, 
     output_file: str | None = None,
     year: int | None = None,
-    month: int | None = None
-) -> pd.DataFrame:
+    month: int | None = None,
+    columns: list[str] | None = None
+) -> pd.DataFrame | None:
     """
     Lee proyecciones consolidadas del dataset.
     
@@ -28,9 +96,12 @@ def read_latest_dataset(
         output_file: Archivo opcional para guardar el resultado (CSV o Parquet)
         year: Año para leer (requerido si se especifica month)
         month: Mes para leer (requerido si se especifica year)
+        columns: Columnas a leer (todas si es None; solo se decodifican esas)
     
     Returns:
-        DataFrame con datos consolidados de la proyección
+        DataFrame con datos consolidados de la proyección, o None si se
+        especificó output_file (las series se escriben al archivo sin
+        cargarlas todas en memoria)
     """
     # Cargar configuración
     app_config = load_app_config()
@@ -44,24 +115,25 @@ def read_latest_dataset(
     # Si se especificó año y mes, leer solo ese mes
     if year is not None and month is not None:
         print(f"🔍 Leyendo proyección: {year}-{month:02d}")
-        df = catalog.read_projection(dataset_id, year, month)
+        
+        if output_file:
+            if not output_file.endswith(('.csv', '.parquet')):
+                print(f"⚠️  Formato no reconocido, guardando como CSV: {output_file}.csv")
+                output_file = f"{output_file}.csv"
+            rows = _write_tables(catalog.iter_projection_tables(dataset_id, year, month, columns), output_file)
+            if rows == 0:
+                raise FileNotFoundError(f"No se encontró proyección para {year}-{month:02d}")
+            print(f"✅ Total de filas: {rows}")
+            print(f"💾 Guardado en: {output_file}")
+            return None
+        
+        df = catalog.read_projection(dataset_id, year, month, columns)
         if df is None:
             raise FileNotFoundError(f"No se encontró proyección para {year}-{month:02d}")
         
         print(f"✅ Total de filas: {len(df)}")
         print(f"📊 Columnas: {', '.join(df.columns)}")
         
-        if output_file:
-            if output_file.endswith('.csv'):
-                df.to_csv(output_file, index=False)
-                print(f"💾 Guardado en: {output_file}")
-            elif output_file.endswith('.parquet'):
-                df.to_parquet(output_file, index=False)
-                print(f"💾 Guardado en: {output_file}")
-            else:
-                print(f"⚠️  Formato no reconocido, guardando como CSV: {output_file}.csv")
-                df.to_csv(f"{output_file}.csv", index=False)
-        
         return df
     
     # Si no se especificó año/mes, leer todos los meses disponibles
@@ -77,11 +149,14 @@ if __name__ == "__main__":
     parser.add_argument("-o", "--output", help="Archivo de salida (CSV o Parquet)")
     parser.add_argument("--year", type=int, help="Año para filtrar (ej: 2025)")
     parser.add_argument("--month", type=int, help="Mes para filtrar (ej: 11)")
+    parser.add_argument("--columns", nargs="+", help="Columnas a leer (ej: obs_time value)")
     
     args = parser.parse_args()
     
     try:
-        df = read_latest_dataset(args.dataset_id, args.output, args.year, args.month)
+        df = read_latest_dataset(args.dataset_id, args.output, args.year, args.month, args.columns)
+        if df is None:
+            sys.exit(0)
         
         # Mostrar preview
         print("\n" + "="*80)
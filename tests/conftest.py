@@ -0,0 +1,24 @@
+"""Shared pytest fixtures."""
+import pytest
+
+from ingestor_reader.infra.event_bus.sns_publisher import get_sns_client
+from ingestor_reader.infra.s3_storage import get_s3_client
+from ingestor_reader.use_cases.steps.filter_new_data import clear_max_date_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_s3_client_cache():
+    """Give each test its own S3 and SNS clients so per-test client patches don't leak."""
+    get_s3_client.cache_clear()
+    get_sns_client.cache_clear()
+    yield
+    get_s3_client.cache_clear()
+    get_sns_client.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_max_date_cache():
+    """Keep cached event max dates from leaking between tests (keys repeat across moto buckets)."""
+    clear_max_date_cache()
+    yield
+    clear_max_date_cache()
@@ -17,7 +17,10 @@ from ingestor_reader.use_cases.steps.consolidation import (
     ConsolidationWriter,
     ConsolidationManifest,
 )
-from ingestor_reader.infra.common import add_year_month_partitions
+from ingestor_reader.infra.common import (
+    add_year_month_partitions,
+    parse_dates,
+)
 from ingestor_reader.infra.s3_catalog import S3Catalog
 from ingestor_reader.infra.s3_storage import S3Storage
 from ingestor_reader.domain.entities.dataset_config import (
@@ -29,9 +32,9 @@ from ingestor_reader.domain.entities.dataset_config import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def aws_resources():
-    """Create AWS resources (S3 bucket) for testing."""
+    """Create AWS resources (S3 bucket) once for the module."""
     with mock_aws():
         # Create S3 bucket
         s3_client = boto3.client("s3", region_name="us-east-1")
@@ -39,14 +42,25 @@ def aws_resources():
         yield {"s3_client": s3_client}
 
 
+@pytest.fixture(autouse=True)
+def empty_bucket(aws_resources):
+    """Delete every object after each test so tests sharing the bucket stay isolated."""
+    yield
+    s3_client = aws_resources["s3_client"]
+    for page in s3_client.get_paginator("list_objects_v2").paginate(Bucket="test-bucket"):
+        keys = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+        if keys:
+            s3_client.delete_objects(Bucket="test-bucket", Delete={"Objects": keys})
+
+
 @pytest.fixture
 def catalog(aws_resources):
-    """Create S3Catalog instance for testing."""
+    """Create S3Catalog instance for testing (per test, since tests patch its attributes)."""
     s3_storage = S3Storage(bucket="test-bucket", region="us-east-1")
     return S3Catalog(s3_storage)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dataset_config():
     """Create a test DatasetConfig."""
     return DatasetConfig(
@@ -59,7 +73,7 @@ def dataset_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
     """Create sample data for testing."""
     return pd.DataFrame({
@@ -269,6 +283,51 @@ def test_consolidate_projection_step_consolidation_error(catalog, dataset_config
     consolidate_projection_step(catalog, dataset_config, sample_data)
 
 
+def test_consolidate_projection_step_failed_month_does_not_stop_others(catalog, dataset_config):
+    """Test that months are all attempted when one of them fails."""
+    df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-15", "2024-02-15", "2024-03-15"]),
+        "internal_series_code": ["SERIES_1", "SERIES_1", "SERIES_1"],
+        "value": [1.0, 2.0, 3.0],
+    })
+    orchestrator = ConsolidationOrchestrator(catalog)
+    
+    def consolidate(config, year, month, primary_keys, has_new_data=False):
+        if (year, month) == (2024, 2):
+            raise Exception("Month error")
+    
+    orchestrator._consolidate_month = Mock(side_effect=consolidate)
+    
+    orchestrator.consolidate_projection_step(dataset_config, df)
+    
+    attempted = {call.args[1:3] for call in orchestrator._consolidate_month.call_args_list}
+    assert attempted == {(2024, 1), (2024, 2), (2024, 3)}
+
+
+def test_consolidate_projection_step_retries_pending_months(catalog, dataset_config, sample_data):
+    """Test that months left in_progress by an earlier run are consolidated again."""
+    catalog.mark_consolidation_pending("test_dataset", 2023, 12)
+    orchestrator = ConsolidationOrchestrator(catalog)
+    orchestrator._consolidate_month = Mock()
+    
+    orchestrator.consolidate_projection_step(dataset_config, sample_data)
+    
+    attempted = [call.args[1:3] for call in orchestrator._consolidate_month.call_args_list]
+    assert sorted(attempted) == [(2023, 12), (2024, 1)]
+
+
+def test_consolidate_projection_step_retries_pending_months_without_delta(catalog, dataset_config):
+    """Test that pending months are retried even when the delta has no valid months."""
+    catalog.mark_consolidation_pending("test_dataset", 2024, 1)
+    orchestrator = ConsolidationOrchestrator(catalog)
+    orchestrator._consolidate_month = Mock()
+    
+    orchestrator.consolidate_projection_step(dataset_config, pd.DataFrame())
+    
+    orchestrator._consolidate_month.assert_called_once()
+    assert orchestrator._consolidate_month.call_args.args[1:3] == (2024, 1)
+
+
 def test_add_year_month_partitions_invalid_dates(catalog):
     """Test extracting year/month with invalid dates."""
     df = pd.DataFrame({
@@ -284,56 +343,104 @@ def test_add_year_month_partitions_invalid_dates(catalog):
     assert result["month"].iloc[0] == 1
 
 
+def test_add_year_month_partitions_pre_epoch_and_tz_aware(catalog):
+    """Test year/month for pre-1970 dates and tz-aware local wall times."""
+    df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["1969-12-31 00:00", "2024-01-31 23:30"]).tz_localize(
+            "America/Argentina/Buenos_Aires"
+        ),
+    })
+    
+    result = add_year_month_partitions(df, "obs_time")
+    
+    # 2024-01-31 23:30 -03:00 is already February in UTC
+    assert result["year"].tolist() == [1969, 2024]
+    assert result["month"].tolist() == [12, 1]
+
+
+def test_parse_dates_uses_frequency_format_with_fallback(catalog):
+    """Test frequency-based date parsing and its fallback to inference."""
+    daily = pd.Series(["2024-01-02", None, "2024-01-03"])
+    monthly = pd.Series(["2024-01", "2024-02"])
+    other_format = pd.Series(["02/01/2024", "2024-01-03"])
+    
+    assert parse_dates(daily, "D").tolist()[::2] == list(pd.to_datetime(["2024-01-02", "2024-01-03"]))
+    assert parse_dates(monthly, "M").tolist() == list(pd.to_datetime(["2024-01-01", "2024-02-01"]))
+    pd.testing.assert_series_equal(
+        parse_dates(other_format, "D"), pd.to_datetime(other_format, errors="coerce")
+    )
+
+
 def test_write_series_projections_success(catalog, sample_data):
-    """Test writing series projections successfully using WAL pattern."""
+    """Test writing series projections directly to their final location."""
     # Group by series
     series_projections = {}
     for series_code, series_data in sample_data.groupby("internal_series_code"):
         series_projections[series_code] = series_data
     
-    # Mock WAL methods
-    catalog.write_series_projection_temp = Mock()
-    catalog.move_series_projection_from_temp = Mock()
+    catalog.write_series_projection = Mock()
     
     writer = ConsolidationWriter(catalog)
     writer.write_series_projections("test_dataset", 2024, 1, series_projections)
     
-    # Should write to temp and move for each series
-    assert catalog.write_series_projection_temp.call_count == 2  # SERIES_1 and SERIES_2
-    assert catalog.move_series_projection_from_temp.call_count == 2
+    # Should write each series once, straight to its final key
+    assert catalog.write_series_projection.call_count == 2  # SERIES_1 and SERIES_2
 
 
-def test_write_series_projections_temp_write_failure(catalog, sample_data):
-    """Test writing series projections when temp write fails."""
+def test_write_series_projections_write_failure(catalog, sample_data):
+    """Test writing series projections when a write fails."""
     # Group by series
     series_projections = {}
     for series_code, series_data in sample_data.groupby("internal_series_code"):
         series_projections[series_code] = series_data
     
-    # Mock write_series_projection_temp to fail
-    catalog.write_series_projection_temp = Mock(side_effect=Exception("Temp write error"))
+    # Mock write_series_projection to fail
+    catalog.write_series_projection = Mock(side_effect=Exception("Write error"))
     
     # Should raise exception
     writer = ConsolidationWriter(catalog)
-    with pytest.raises(Exception, match="Temp write error"):
+    with pytest.raises(Exception, match="Write error"):
         writer.write_series_projections("test_dataset", 2024, 1, series_projections)
 
 
-def test_write_series_projections_move_failure(catalog, sample_data):
-    """Test writing series projections when move fails."""
-    # Group by series
-    series_projections = {}
-    for series_code, series_data in sample_data.groupby("internal_series_code"):
-        series_projections[series_code] = series_data
+def test_write_series_projections_writes_final_objects(catalog, sample_data):
+    """Test that projections land at their final keys with no temp objects left."""
+    series_projections = {
+        series_code: series_data.reset_index(drop=True)
+        for series_code, series_data in sample_data.groupby("internal_series_code")
+    }
     
-    # Mock temp write succeeds, move fails
-    catalog.write_series_projection_temp = Mock()
-    catalog.move_series_projection_from_temp = Mock(side_effect=Exception("Move error"))
+    writer = ConsolidationWriter(catalog)
+    writer.write_series_projections("test_dataset", 2024, 1, series_projections)
     
-    # Should raise exception
+    for series_code, expected_df in series_projections.items():
+        result = catalog.read_series_projection("test_dataset", series_code, 2024, 1)
+        pd.testing.assert_frame_equal(result, expected_df)
+    keys = catalog.s3.list_objects("datasets/test_dataset/projections/windows/")
+    assert not any("/.tmp/" in key for key in keys)
+
+
+def test_read_projection_combines_series_for_month(catalog, sample_data):
+    """Test that a month's projection is read from every series in key order."""
+    series_projections = {
+        series_code: series_data.reset_index(drop=True)
+        for series_code, series_data in sample_data.groupby("internal_series_code")
+    }
     writer = ConsolidationWriter(catalog)
-    with pytest.raises(Exception, match="Move error"):
-        writer.write_series_projections("test_dataset", 2024, 1, series_projections)
+    writer.write_series_projections("test_dataset", 2024, 1, series_projections)
+    writer.write_series_projections("test_dataset", 2024, 2, {"OTHER": sample_data.head(1)})
+    
+    result = catalog.read_projection("test_dataset", 2024, 1)
+    
+    expected = pd.concat(
+        [series_projections[code] for code in sorted(series_projections)], ignore_index=True
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    assert catalog.read_projection("test_dataset", 2024, 3) is None
+    
+    values = catalog.read_projection("test_dataset", 2024, 1, columns=["value"])
+    assert list(values.columns) == ["value"]
+    assert values["value"].tolist() == expected["value"].tolist()
 
 
 def test_consolidate_month_projections_multiple_events(catalog):
@@ -407,6 +514,18 @@ def test_consolidate_month_projections_mixed_valid_invalid_events(catalog, sampl
     assert "SERIES_2" in result
 
 
+def test_read_events_for_month_preserves_key_order(catalog, sample_data):
+    """Test that concurrently read events come back in event key order, skipping failures."""
+    keys = [f"events/part-{i}.parquet" for i in range(5)]
+    for i, key in enumerate(keys):
+        if i != 2:
+            catalog.s3.put_object(key, catalog.parquet_io.write_to_bytes(sample_data.assign(value=float(i))))
+    
+    result = _read_events_for_month(catalog, keys)
+    
+    assert [df["value"].iloc[0] for df in result] == [0.0, 1.0, 3.0, 4.0]
+
+
 def test_get_affected_months(catalog):
     """Test extracting affected months from DataFrame."""
     df = pd.DataFrame({
@@ -439,6 +558,19 @@ def test_get_affected_months_deduplicates(catalog):
     assert (2024, 1) in result
 
 
+def test_get_single_affected_month(catalog):
+    """Test the single-month fast path for affected months."""
+    orchestrator = ConsolidationOrchestrator(catalog)
+    
+    same_month = pd.Series(pd.to_datetime(["2024-01-20", "2024-01-02", None]))
+    several_months = pd.Series(pd.to_datetime(["2024-01-31", "2024-02-01"]))
+    no_valid_dates = pd.Series(["invalid", None])
+    
+    assert orchestrator._get_single_affected_month(same_month) == [(2024, 1)]
+    assert orchestrator._get_single_affected_month(several_months) is None
+    assert orchestrator._get_single_affected_month(no_valid_dates) == []
+
+
 def test_is_already_consolidated_true(catalog):
     """Test checking if month is already consolidated (returns True)."""
     # Mock manifest with completed status
@@ -479,7 +611,7 @@ def test_consolidate_month_idempotency(catalog, dataset_config, sample_data):
     catalog.read_consolidation_manifest = Mock(return_value={"status": "completed"})
     
     # Should not call consolidation methods
-    catalog.cleanup_temp_projections = Mock()
+    catalog.mark_consolidation_pending = Mock()
     catalog.write_consolidation_manifest = Mock()
     catalog.list_events_for_month = Mock()
     
@@ -487,59 +619,62 @@ def test_consolidate_month_idempotency(catalog, dataset_config, sample_data):
     orchestrator._consolidate_month(dataset_config, 2024, 1, ["obs_time", "internal_series_code"])
     
     # Should skip consolidation
-    catalog.cleanup_temp_projections.assert_not_called()
+    catalog.mark_consolidation_pending.assert_not_called()
     catalog.write_consolidation_manifest.assert_not_called()
     catalog.list_events_for_month.assert_not_called()
 
 
-def test_consolidate_month_cleanup_temp_on_start(catalog, dataset_config, sample_data):
-    """Test that _consolidate_month cleans up temp files on start."""
-    # Mock not consolidated
-    catalog.read_consolidation_manifest = Mock(return_value=None)
-    catalog.cleanup_temp_projections = Mock()
+def test_consolidate_month_new_data_ignores_completed_manifest(catalog, dataset_config):
+    """Test that months with new data are re-consolidated without reading the manifest."""
+    catalog.read_consolidation_manifest = Mock(return_value={"status": "completed"})
     catalog.write_consolidation_manifest = Mock()
-    
-    # Mock consolidation to return empty (early return)
     catalog.list_events_for_month = Mock(return_value=[])
     
     orchestrator = ConsolidationOrchestrator(catalog)
-    orchestrator._consolidate_month(dataset_config, 2024, 1, ["obs_time", "internal_series_code"])
+    orchestrator._consolidate_month(
+        dataset_config, 2024, 1, ["obs_time", "internal_series_code"], has_new_data=True
+    )
     
-    # Should cleanup temp files
-    catalog.cleanup_temp_projections.assert_called_once_with("test_dataset", 2024, 1)
+    catalog.read_consolidation_manifest.assert_not_called()
+    catalog.list_events_for_month.assert_called_once()
 
 
-def test_consolidate_month_cleanup_temp_on_error(catalog, dataset_config, sample_data):
-    """Test that _consolidate_month cleans up temp files on error."""
-    # Mock not consolidated
-    catalog.read_consolidation_manifest = Mock(return_value=None)
-    catalog.cleanup_temp_projections = Mock()
-    catalog.write_consolidation_manifest = Mock()
-    
-    # Mock consolidation to raise error
+def test_consolidate_month_error_leaves_month_pending(catalog, dataset_config):
+    """Test that a failed consolidation leaves the month pending for a retry."""
     catalog.list_events_for_month = Mock(side_effect=Exception("Consolidation error"))
     
     orchestrator = ConsolidationOrchestrator(catalog)
     with pytest.raises(Exception, match="Consolidation error"):
         orchestrator._consolidate_month(dataset_config, 2024, 1, ["obs_time", "internal_series_code"])
     
-    # Should cleanup temp files twice (on start and on error)
-    assert catalog.cleanup_temp_projections.call_count == 2
+    assert catalog.list_pending_consolidations("test_dataset") == [(2024, 1)]
+    assert catalog.read_consolidation_manifest("test_dataset", 2024, 1)["status"] == "in_progress"
+
+
+def test_consolidate_month_completed_clears_pending(catalog, dataset_config, sample_data):
+    """Test that completing a month removes its pending marker."""
+    catalog.list_events_for_month = Mock(return_value=["event1.parquet"])
+    catalog.s3.get_object = Mock(return_value=b"parquet-data")
+    catalog._event_store.parquet_io.read_from_bytes = Mock(return_value=sample_data)
+    catalog.write_series_projection = Mock()
+    
+    orchestrator = ConsolidationOrchestrator(catalog)
+    orchestrator._consolidate_month(dataset_config, 2024, 1, ["obs_time", "internal_series_code"])
+    
+    assert catalog.list_pending_consolidations("test_dataset") == []
 
 
 def test_consolidate_month_manifest_lifecycle(catalog, dataset_config, sample_data):
     """Test manifest lifecycle (in_progress -> completed)."""
     # Mock not consolidated
     catalog.read_consolidation_manifest = Mock(return_value=None)
-    catalog.cleanup_temp_projections = Mock()
     catalog.write_consolidation_manifest = Mock()
     
     # Mock successful consolidation
     catalog.list_events_for_month = Mock(return_value=["event1.parquet"])
     catalog.s3.get_object = Mock(return_value=b"parquet-data")
     catalog._event_store.parquet_io.read_from_bytes = Mock(return_value=sample_data)
-    catalog.write_series_projection_temp = Mock()
-    catalog.move_series_projection_from_temp = Mock()
+    catalog.write_series_projection = Mock()
     
     orchestrator = ConsolidationOrchestrator(catalog)
     orchestrator._consolidate_month(dataset_config, 2024, 1, ["obs_time", "internal_series_code"])
@@ -550,11 +685,41 @@ def test_consolidate_month_manifest_lifecycle(catalog, dataset_config, sample_da
     catalog.write_consolidation_manifest.assert_any_call("test_dataset", 2024, 1, status="completed")
 
 
+def test_consolidate_month_splits_s3_pool_between_months(catalog, dataset_config, sample_data):
+    """Test that each month reads events and writes projections with its share of the S3 pool."""
+    from ingestor_reader.infra.common import prefetch_map, run_concurrently
+    from ingestor_reader.infra.s3_storage import S3_MAX_POOL_CONNECTIONS
+    from ingestor_reader.use_cases.steps.consolidation.orchestrator import (
+        MONTH_WORKERS,
+        S3_WORKERS_PER_MONTH,
+    )
+    
+    catalog.list_events_for_month = Mock(return_value=["event1.parquet"])
+    catalog.s3.get_object = Mock(return_value=b"parquet-data")
+    catalog._event_store.parquet_io.read_from_bytes = Mock(return_value=sample_data)
+    catalog.write_series_projection = Mock()
+    orchestrator = ConsolidationOrchestrator(catalog)
+    
+    # A share that differs from both defaults, so only the orchestrator can have passed it
+    with patch(
+        "ingestor_reader.use_cases.steps.consolidation.orchestrator.S3_WORKERS_PER_MONTH", 3
+    ), patch(
+        "ingestor_reader.domain.services.consolidation_service.prefetch_map", wraps=prefetch_map
+    ) as event_reads, patch(
+        "ingestor_reader.use_cases.steps.consolidation.writer.run_concurrently", wraps=run_concurrently
+    ) as projection_writes:
+        orchestrator._consolidate_month(dataset_config, 2024, 1, ["obs_time", "internal_series_code"])
+    
+    assert event_reads.call_args.kwargs["max_workers"] == 3
+    assert projection_writes.call_args.kwargs["max_workers"] == 3
+    assert catalog.write_series_projection.call_count == 2
+    assert MONTH_WORKERS * S3_WORKERS_PER_MONTH <= S3_MAX_POOL_CONNECTIONS
+
+
 def test_consolidate_month_no_series_projections(catalog, dataset_config):
     """Test _consolidate_month when no series projections are returned."""
     # Mock not consolidated
     catalog.read_consolidation_manifest = Mock(return_value=None)
-    catalog.cleanup_temp_projections = Mock()
     catalog.write_consolidation_manifest = Mock()
     
     # Mock consolidation to return empty dict
@@ -565,6 +730,8 @@ def test_consolidate_month_no_series_projections(catalog, dataset_config):
     
     # Should mark as in_progress but not completed (early return)
     catalog.write_consolidation_manifest.assert_called_once_with("test_dataset", 2024, 1, status="in_progress")
+    # Nothing to regenerate from, so the month isn't retried
+    assert catalog.list_pending_consolidations("test_dataset") == []
 
 
 def test_read_consolidation_manifest_success(catalog):
@@ -608,64 +775,41 @@ def test_write_consolidation_manifest(catalog):
     assert call_args[1]["content_type"] == "application/json"
 
 
-def test_cleanup_temp_projections(catalog):
-    """Test cleaning up temporary projections."""
-    # Mock list_objects to return temp keys
-    catalog.s3.list_objects = Mock(return_value=[
-        "datasets/test_dataset/projections/windows/SERIES_1/year=2024/month=01/.tmp/data.parquet",
-        "datasets/test_dataset/projections/windows/SERIES_1/year=2024/month=01/data.parquet",
-        "datasets/test_dataset/projections/windows/SERIES_2/year=2024/month=01/.tmp/data.parquet",
-    ])
+def test_list_pending_consolidations(catalog):
+    """Test that pending markers are listed as sorted (year, month) tuples."""
+    catalog.mark_consolidation_pending("test_dataset", 2024, 11)
+    catalog.mark_consolidation_pending("test_dataset", 2023, 2)
+    catalog.mark_consolidation_pending("other_dataset", 2024, 1)
     
-    catalog.s3.s3_client.delete_object = Mock()
+    assert catalog.list_pending_consolidations("test_dataset") == [(2023, 2), (2024, 11)]
     
-    catalog.cleanup_temp_projections("test_dataset", 2024, 1)
+    catalog.clear_consolidation_pending("test_dataset", 2023, 2)
     
-    # Should delete only temp files (2 temp files)
-    assert catalog.s3.s3_client.delete_object.call_count == 2
+    assert catalog.list_pending_consolidations("test_dataset") == [(2024, 11)]
 
 
-def test_cleanup_temp_projections_no_temp_files(catalog):
-    """Test cleaning up when no temp files exist."""
-    # Mock list_objects to return no temp keys
-    catalog.s3.list_objects = Mock(return_value=[
-        "datasets-test/test_dataset/projections/windows/SERIES_1/year=2024/month=01/data.parquet",
-    ])
-    
-    catalog.s3.s3_client.delete_object = Mock()
+def test_write_series_projection_uses_single_zstd_row_group(catalog):
+    """Test that projection shards are written as one zstd-compressed row group."""
+    import io
+    import pyarrow.parquet as pq
     
-    catalog.cleanup_temp_projections("test_dataset", 2024, 1)
+    df = pd.DataFrame({"series_code": ["SERIES_1"] * 5, "value": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    catalog.write_series_projection("test_dataset", "SERIES_1", 2024, 1, df)
     
-    # Should not delete anything
-    catalog.s3.s3_client.delete_object.assert_not_called()
+    key = catalog.paths.projection_series_key("test_dataset", "SERIES_1", 2024, 1)
+    metadata = pq.ParquetFile(io.BytesIO(catalog.s3.get_object(key))).metadata
+    assert metadata.num_row_groups == 1
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
 
 
-def test_move_series_projection_from_temp(catalog):
-    """Test moving series projection from temp to final location."""
-    # Mock get_object to return data
-    catalog.s3.get_object = Mock(return_value=b"parquet-data")
-    catalog.s3.put_object = Mock()
-    catalog.s3.s3_client.delete_object = Mock()
+def test_write_series_projection_small_uses_single_put(catalog):
+    """Test that small projections are sent with one PutObject, not a managed upload."""
+    df = pd.DataFrame({"series_code": ["SERIES_1"] * 5, "value": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    client = catalog.s3.s3_client
     
-    catalog.move_series_projection_from_temp("test_dataset", "SERIES_1", 2024, 1)
+    with patch.object(client, "put_object", wraps=client.put_object) as mock_put, \
+            patch.object(client, "upload_fileobj") as mock_upload:
+        catalog.write_series_projection("test_dataset", "SERIES_1", 2024, 1, df)
     
-    # Should copy from temp to final
-    assert catalog.s3.put_object.called
-    # Should delete temp
-    assert catalog.s3.s3_client.delete_object.called
-
-
-def test_move_series_projection_from_temp_delete_ignores_error(catalog):
-    """Test that move ignores error when deleting temp file."""
-    # Mock get_object and put_object to succeed
-    catalog.s3.get_object = Mock(return_value=b"parquet-data")
-    catalog.s3.put_object = Mock()
-    # Mock delete to raise error
-    catalog.s3.s3_client.delete_object = Mock(side_effect=Exception("Delete error"))
-    
-    # Should not raise error
-    catalog.move_series_projection_from_temp("test_dataset", "SERIES_1", 2024, 1)
-    
-    # Should still succeed
-    assert catalog.s3.put_object.called
-
+    mock_put.assert_called_once()
+    mock_upload.assert_not_called()
@@ -0,0 +1,34 @@
+"""Tests for dataframe utilities."""
+import pytest
+import pandas as pd
+
+from ingestor_reader.infra.common import as_datetime, year_month_partition_indices
+
+
+def test_year_month_partition_indices():
+    """Test grouping row positions by year/month without adding columns."""
+    df = pd.DataFrame({
+        "obs_time": ["2024-02-01", "2024-01-15", "invalid", "2024-02-20", None],
+        "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+    
+    result = year_month_partition_indices(df, "obs_time")
+    
+    # Groups in order of first appearance; invalid dates excluded
+    assert list(result.keys()) == [(2024, 2), (2024, 1)]
+    assert list(result[(2024, 2)]) == [0, 3]
+    assert list(result[(2024, 1)]) == [1]
+    assert list(df.columns) == ["obs_time", "value"]
+
+
+def test_as_datetime_skips_parse_for_datetime_columns():
+    """Test that datetime columns are returned as-is and others are parsed."""
+    naive = pd.Series(pd.to_datetime(["2024-01-02"]))
+    aware = naive.dt.tz_localize("UTC")
+    strings = pd.Series(["2024-01-02", "invalid"])
+    
+    assert as_datetime(naive) is naive
+    assert as_datetime(aware) is aware
+    assert as_datetime(strings).isna().tolist() == [False, True]
+    with pytest.raises(ValueError):
+        as_datetime(strings, errors="raise")
@@ -5,6 +5,7 @@ import pytest
 from ingestor_reader.domain.services.delta_service import (
     compute_delta,
     compute_key_hash,
+    compute_key_hashes,
     update_index,
 )
 
@@ -62,6 +63,18 @@ def test_compute_delta_incremental():
     assert delta3.iloc[0]["obs_time"] == "2024-01-04"
 
 
+def test_compute_delta_leaves_input_untouched():
+    """Test that compute_delta does not add key_hash to the caller's frame."""
+    normalized_df = pd.DataFrame({"code": ["A", "B"], "value": [1.0, 2.0]})
+    
+    delta = compute_delta(normalized_df, None, ["code"])
+    delta.loc[delta.index[0], "value"] = 99.0
+    
+    assert "key_hash" in delta.columns
+    assert list(normalized_df.columns) == ["code", "value"]
+    assert normalized_df["value"].tolist() == [1.0, 2.0]
+
+
 def test_compute_delta_idempotent():
     """Test that delta computation is idempotent."""
     df = pd.DataFrame({
@@ -108,3 +121,31 @@ def test_update_index():
     assert len(index3) == 5  # hash4 deduplicated
     assert set(index3["key_hash"]) == {"hash1", "hash2", "hash3", "hash4", "hash5"}
 
+
+
+def test_compute_key_hashes_matches_row_hash():
+    """Test vectorized key hashes match the per-row hash."""
+    df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-01", "2024-01-02"]).tz_localize("UTC"),
+        "code": ["A", "B"],
+        "value": [1.0, None],
+    })
+    
+    hashes = compute_key_hashes(df, ["obs_time", "code"])
+    
+    expected = [compute_key_hash(row, ["obs_time", "code"]) for _, row in df.iterrows()]
+    assert list(hashes) == expected
+    assert list(hashes.index) == list(df.index)
+
+
+def test_compute_key_hashes_matches_row_hash_for_numeric_frames():
+    """Test that int keys upcast to float in all-numeric rows hash like the row path."""
+    df = pd.DataFrame({
+        "series_id": [1, 2],
+        "value": [1.5, 2.0],
+    })
+    
+    hashes = compute_key_hashes(df, ["series_id"])
+    
+    expected = df.apply(lambda row: compute_key_hash(row, ["series_id"]), axis=1)
+    assert list(hashes) == list(expected)
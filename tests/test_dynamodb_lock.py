@@ -180,6 +180,17 @@ def test_is_locked_expired(lock_manager):
     assert lock_manager.is_locked(lock_key) is False
 
 
+def test_is_locked_uses_consistent_read(lock_manager):
+    """Test that lock checks use strongly consistent reads."""
+    lock_key = "pipeline:test_dataset"
+    lock_manager.acquire(lock_key, "run-123")
+    
+    with patch.object(lock_manager.table, "get_item", wraps=lock_manager.table.get_item) as mock_get:
+        assert lock_manager.is_locked(lock_key) is True
+    
+    assert mock_get.call_args[1]["ConsistentRead"] is True
+
+
 def test_is_locked_not_exists(lock_manager):
     """Test checking if a non-existent lock exists."""
     lock_key = "pipeline:nonexistent"
@@ -0,0 +1,96 @@
+"""Tests for enrich metadata step."""
+import pytest
+import pandas as pd
+import pyarrow as pa
+from datetime import date
+
+from ingestor_reader.domain.entities.dataset_config import (
+    DatasetConfig,
+    SourceConfig,
+    ParseConfig,
+    NormalizeConfig,
+    OutputConfig,
+)
+from ingestor_reader.infra.parquet_io import ParquetIO
+from ingestor_reader.use_cases.steps.enrich_metadata import ARROW_STRING_DTYPE, enrich_metadata
+
+
+@pytest.fixture
+def dataset_config():
+    """Create a test DatasetConfig."""
+    return DatasetConfig(
+        dataset_id="test_dataset",
+        frequency="daily",
+        source=SourceConfig(kind="http", url="http://example.com/data.xlsx", format="xlsx"),
+        parse=ParseConfig(plugin="test_parser"),
+        normalize=NormalizeConfig(plugin="test_normalizer", primary_keys=["obs_time", "internal_series_code"]),
+        output=OutputConfig(),
+    )
+
+
+def test_enrich_metadata_adds_columns_without_mutating_input(dataset_config):
+    """Test that metadata columns are added to a new frame."""
+    df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        "value": [1.0, 2.0],
+    })
+
+    result = enrich_metadata(df, dataset_config, "v1")
+
+    assert list(df.columns) == ["obs_time", "value"]
+    assert result["dataset_id"].tolist() == ["test_dataset", "test_dataset"]
+    assert result["internal_series_code"].tolist() == ["test_dataset", "test_dataset"]
+    assert result["source_kind"].tolist() == ["FILE", "FILE"]
+    assert result["version"].tolist() == ["v1", "v1"]
+    assert result["quality_flag"].tolist() == ["OK", "OK"]
+
+
+def test_enrich_metadata_obs_date_is_local_date32(dataset_config):
+    """Test that obs_date keeps the local calendar date and is stored as a Parquet date."""
+    df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-31 23:30", "2024-02-01 00:00"]).tz_localize(
+            "America/Argentina/Buenos_Aires"
+        ),
+        "value": [1.0, 2.0],
+    })
+
+    result = enrich_metadata(df, dataset_config, "v1")
+
+    assert result["obs_date"].tolist() == [date(2024, 1, 31), date(2024, 2, 1)]
+    table = pa.Table.from_pandas(result)
+    assert table.schema.field("obs_date").type == pa.date32()
+    assert ParquetIO().read_from_bytes(ParquetIO().write_to_bytes(result))["obs_date"].tolist() == [
+        date(2024, 1, 31), date(2024, 2, 1)
+    ]
+
+
+def test_enrich_metadata_adds_constants_as_arrow_strings(dataset_config):
+    """Test that constant string columns use the same string dtype as the other columns."""
+    df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        "value": [1.0, 2.0],
+        "internal_series_code": ["SERIES_1", "SERIES_2"],
+    })
+
+    result = enrich_metadata(df, dataset_config, "v1")
+
+    for column in ["dataset_id", "provider", "frequency", "unit", "source_kind", "version", "quality_flag"]:
+        assert result[column].dtype == ARROW_STRING_DTYPE, column
+    round_trip = ParquetIO().read_from_bytes(ParquetIO().write_to_bytes(result))
+    assert round_trip["version"].tolist() == ["v1", "v1"]
+    assert round_trip["version"].dtype == round_trip["internal_series_code"].dtype
+
+
+def test_enrich_metadata_casts_object_strings_to_arrow(dataset_config):
+    """Test that object-dtype string columns come out Arrow-backed."""
+    df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        "value": [1.0, 2.0],
+        "internal_series_code": pd.Series(["SERIES_1", None], dtype=object),
+    })
+
+    result = enrich_metadata(df, dataset_config, "v1")
+
+    assert result["internal_series_code"].dtype == pd.StringDtype("pyarrow", na_value=float("nan"))
+    assert result["internal_series_code"].iloc[0] == "SERIES_1"
+    assert pd.isna(result["internal_series_code"].iloc[1])
@@ -0,0 +1,52 @@
+"""Tests for fetch resource step."""
+from unittest.mock import MagicMock, patch
+
+from ingestor_reader.infra.common import compute_file_hash
+from ingestor_reader.use_cases.steps.fetch_resource import (
+    fetch_resource,
+    fetch_resource_with_hash,
+    get_http_session,
+)
+
+
+def _mock_response(chunks):
+    """Build a streaming requests response yielding the given chunks."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+@patch("ingestor_reader.use_cases.steps.fetch_resource.get_http_session")
+def test_fetch_resource_with_hash_streams_and_hashes(mock_session):
+    """Test that the streamed content and its hash match a whole-body hash."""
+    chunks = [b"abc", b"def", b"ghi"]
+    mock_get = mock_session.return_value.get
+    mock_get.return_value = _mock_response(chunks)
+
+    content, file_hash = fetch_resource_with_hash("http://example.com/data.xlsx")
+
+    assert content == b"abcdefghi"
+    assert file_hash == compute_file_hash(b"abcdefghi")
+    assert mock_get.call_args.kwargs["stream"] is True
+    mock_get.return_value.raise_for_status.assert_called_once()
+
+
+@patch("ingestor_reader.use_cases.steps.fetch_resource.get_http_session")
+def test_fetch_resource_returns_content(mock_session):
+    """Test that fetch_resource still returns just the content bytes."""
+    mock_get = mock_session.return_value.get
+    mock_get.return_value = _mock_response([b"data"])
+
+    assert fetch_resource("http://example.com/data.xlsx", verify_ssl=False) == b"data"
+    assert mock_get.call_args.kwargs["verify"] is False
+
+
+def test_get_http_session_is_shared_and_retries():
+    """Test that fetches share one session with a retrying connection pool."""
+    session = get_http_session()
+
+    assert get_http_session() is session
+    adapter = session.get_adapter("https://example.com")
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
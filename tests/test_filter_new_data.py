@@ -0,0 +1,248 @@
+"""Tests for filter new data step."""
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ingestor_reader.infra.parquet_io import ParquetIO
+from ingestor_reader.use_cases.steps.filter_new_data import (
+    PARQUET_FOOTER_READ_SIZE,
+    _get_latest_date_from_events,
+    _get_max_date_from_file,
+    filter_new_data,
+)
+
+
+def _mock_catalog(df: pd.DataFrame) -> MagicMock:
+    body = ParquetIO().write_to_bytes(df)
+    catalog = MagicMock()
+    catalog.s3.bucket = "test-bucket"
+    catalog.s3.get_object.return_value = body
+    catalog.s3.get_object_range.side_effect = lambda key, byte_range: body[-int(byte_range.split("-")[-1]):]
+    catalog.parquet_io = ParquetIO()
+    return catalog
+
+
+def test_get_max_date_from_file_is_cached_per_key():
+    """Test that an event file is downloaded once across repeated lookups."""
+    catalog = _mock_catalog(pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-01", "2024-01-05"]),
+        "value": [1.0, 2.0],
+    }))
+
+    first = _get_max_date_from_file(catalog, "events/v1/data/part-0.parquet")
+    second = _get_max_date_from_file(catalog, "events/v1/data/part-0.parquet")
+
+    assert first == second == pd.Timestamp("2024-01-05")
+    catalog.s3.get_object_range.assert_called_once()
+
+    _get_max_date_from_file(catalog, "events/v2/data/part-0.parquet")
+    assert catalog.s3.get_object_range.call_count == 2
+
+
+def test_get_max_date_from_file_does_not_cache_missing_dates():
+    """Test that files without a date column are re-read."""
+    catalog = _mock_catalog(pd.DataFrame({"value": [1.0]}))
+
+    assert _get_max_date_from_file(catalog, "events/v1/data/part-0.parquet") is None
+    assert _get_max_date_from_file(catalog, "events/v1/data/part-0.parquet") is None
+    assert catalog.s3.get_object_range.call_count == 2
+
+
+def test_get_max_date_from_file_uses_footer_statistics():
+    """Test that the max date comes from the footer without downloading the file."""
+    obs_time = pd.to_datetime(["2024-01-31 23:30", "2024-03-01 23:30"]).tz_localize(
+        "America/Argentina/Buenos_Aires"
+    )
+    catalog = _mock_catalog(pd.DataFrame({"obs_time": obs_time, "value": [1.0, 2.0]}))
+
+    max_date = _get_max_date_from_file(catalog, "events/v1/data/part-0.parquet")
+
+    assert max_date == obs_time.max()
+    assert str(max_date.tz) == "America/Argentina/Buenos_Aires"
+    catalog.s3.get_object_range.assert_called_once_with(
+        "events/v1/data/part-0.parquet", f"bytes=-{PARQUET_FOOTER_READ_SIZE}"
+    )
+    catalog.s3.get_object.assert_not_called()
+
+
+def test_get_max_date_from_file_falls_back_without_statistics():
+    """Test that files written without statistics are read in full."""
+    df = pd.DataFrame({"obs_date": [date(2024, 1, 1), date(2024, 2, 1)], "value": [1.0, 2.0]})
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), sink, write_statistics=False)
+    body = sink.getvalue().to_pybytes()
+    catalog = MagicMock()
+    catalog.s3.bucket = "test-bucket"
+    catalog.s3.get_object.return_value = body
+    catalog.s3.get_object_range.return_value = body
+    catalog.parquet_io = ParquetIO()
+
+    with patch.object(catalog.parquet_io, "read_from_bytes", wraps=catalog.parquet_io.read_from_bytes) as read:
+        assert _get_max_date_from_file(catalog, "events/v1/data/part-0.parquet") == pd.Timestamp("2024-02-01")
+    catalog.s3.get_object.assert_called_once()
+    assert read.call_args.kwargs["columns"] == ["obs_date"]
+
+
+def test_get_max_date_from_file_fetches_large_footer_by_range():
+    """Test that a footer larger than the first tail is fetched with a second ranged GET."""
+    catalog = _mock_catalog(pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-01", "2024-01-05"]),
+        "value": [1.0, 2.0],
+    }))
+
+    with patch("ingestor_reader.use_cases.steps.filter_new_data.PARQUET_FOOTER_READ_SIZE", 16):
+        max_date = _get_max_date_from_file(catalog, "events/v1/data/part-0.parquet")
+
+    assert max_date == pd.Timestamp("2024-01-05")
+    assert catalog.s3.get_object_range.call_count == 2
+    catalog.s3.get_object.assert_not_called()
+
+
+def test_read_metadata_from_tail_needs_whole_footer():
+    """Test that a tail shorter than the footer is rejected."""
+    body = ParquetIO().write_to_bytes(pd.DataFrame({"value": [1.0]}))
+
+    assert ParquetIO().read_metadata_from_tail(body[-8:]) is None
+    assert ParquetIO().read_metadata_from_tail(b"") is None
+    assert ParquetIO().read_metadata_from_tail(body).metadata.num_rows == 1
+
+
+def test_get_latest_date_from_events_takes_max_over_files():
+    """Test that the latest date is the max across all output files of the last event."""
+    max_dates = {
+        "events/v2/data/part-0.parquet": pd.Timestamp("2024-02-01"),
+        "events/v2/data/part-1.parquet": None,
+        "events/v2/data/part-2.parquet": pd.Timestamp("2024-03-01"),
+        "events/v2/data/part-3.parquet": pd.Timestamp("2024-01-01"),
+    }
+    catalog = MagicMock()
+    catalog.read_current_manifest.return_value = {"current_version": "v2"}
+    catalog.read_event_manifest.return_value = {"outputs": {"files": list(max_dates)}}
+
+    with patch(
+        "ingestor_reader.use_cases.steps.filter_new_data._get_max_date_from_file",
+        side_effect=lambda _catalog, file_key: max_dates[file_key],
+    ):
+        assert _get_latest_date_from_events(catalog, "test_dataset") == pd.Timestamp("2024-03-01")
+
+
+def test_get_latest_date_from_events_uses_manifest_max_date():
+    """Test that a max_date recorded in the event manifest skips reading the output files."""
+    catalog = MagicMock()
+    catalog.read_current_manifest.return_value = {"current_version": "v2"}
+    catalog.read_event_manifest.return_value = {
+        "outputs": {"files": ["events/v2/data/part-0.parquet"], "max_date": "2024-03-01T00:00:00-03:00"},
+    }
+
+    with patch("ingestor_reader.use_cases.steps.filter_new_data._get_max_date_from_file") as get_max_date:
+        latest_date = _get_latest_date_from_events(catalog, "test_dataset")
+
+    assert latest_date == pd.Timestamp("2024-03-01 03:00", tz="UTC")
+    get_max_date.assert_not_called()
+
+
+def _filter_with_cutoff(parsed_df: pd.DataFrame, cutoff: pd.Timestamp) -> pd.DataFrame:
+    with patch(
+        "ingestor_reader.use_cases.steps.filter_new_data._get_latest_date_from_events",
+        return_value=cutoff,
+    ):
+        return filter_new_data(MagicMock(), "test_dataset", parsed_df)
+
+
+def test_filter_new_data_returns_input_when_all_rows_are_new():
+    """Test that the input frame is returned as is when every row is after the cutoff."""
+    parsed_df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-02-01", "2024-02-02"]),
+        "value": [1.0, 2.0],
+    })
+
+    result = _filter_with_cutoff(parsed_df, pd.Timestamp("2024-01-31", tz="UTC"))
+
+    assert result is parsed_df
+
+
+def test_filter_new_data_returns_empty_when_no_row_is_new():
+    """Test that nothing is kept when every row is at or before the cutoff."""
+    parsed_df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-01", "2024-01-31"]),
+        "value": [1.0, 2.0],
+    })
+
+    result = _filter_with_cutoff(parsed_df, pd.Timestamp("2024-01-31"))
+
+    assert result.empty
+    assert list(result.columns) == ["obs_time", "value"]
+
+
+def test_filter_new_data_keeps_rows_after_cutoff():
+    """Test that only rows after the cutoff are kept when the data straddles it."""
+    parsed_df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-30", "2024-01-31", "2024-02-01", None]),
+        "value": [1.0, 2.0, 3.0, 4.0],
+    })
+
+    result = _filter_with_cutoff(parsed_df, pd.Timestamp("2024-01-31"))
+
+    assert result["value"].tolist() == [3.0]
+
+
+def test_filter_new_data_compares_wall_time_and_keeps_column_dtype():
+    """Test that a tz-aware column is compared by wall time with a naive cutoff, unchanged in the result."""
+    obs_time = pd.to_datetime(["2024-01-31 20:00", "2024-01-31 22:00"]).tz_localize(
+        "America/Argentina/Buenos_Aires"
+    )
+    parsed_df = pd.DataFrame({"obs_time": obs_time, "value": [1.0, 2.0]})
+
+    result = _filter_with_cutoff(parsed_df, pd.Timestamp("2024-01-31 21:00"))
+
+    assert result["value"].tolist() == [2.0]
+    assert result["obs_time"].dtype == parsed_df["obs_time"].dtype
+
+
+def test_filter_new_data_slices_sorted_input_after_cutoff():
+    """Test that date-sorted input keeps every row after the cutoff, including ties at it."""
+    parsed_df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-30", "2024-01-31", "2024-01-31", "2024-02-01", "2024-02-02"]),
+        "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+
+    result = _filter_with_cutoff(parsed_df, pd.Timestamp("2024-01-31"))
+
+    assert result["value"].tolist() == [4.0, 5.0]
+    assert result.index.tolist() == [3, 4]
+
+
+def test_filter_new_data_sorted_input_with_sub_unit_cutoff():
+    """Test that sorted second/microsecond columns accept a cutoff finer than their unit."""
+    for unit in ["s", "us"]:
+        parsed_df = pd.DataFrame({
+            "obs_time": pd.to_datetime([
+                "2024-01-01 00:00:00",
+                "2024-01-02 00:00:00",
+                "2024-01-02 00:00:00",
+                "2024-01-02 00:00:01",
+                "2024-01-03 00:00:00",
+            ]).as_unit(unit),
+            "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+        })
+
+        result = _filter_with_cutoff(parsed_df, pd.Timestamp("2024-01-02 00:00:00.5"))
+
+        assert result["value"].tolist() == [4.0, 5.0], unit
+        assert result.index.tolist() == [3, 4], unit
+
+
+def test_filter_new_data_unsorted_input_compares_instants():
+    """Test the mask path on unsorted tz-aware input against a cutoff in another zone and unit."""
+    obs_time = pd.to_datetime(
+        ["2024-02-01 00:00:00.000002", "2024-01-31 00:00:00.000000", "2024-02-01 00:00:00.000001", None]
+    ).tz_localize("America/Argentina/Buenos_Aires").as_unit("us")
+    parsed_df = pd.DataFrame({"obs_time": obs_time, "value": [1.0, 2.0, 3.0, 4.0]})
+
+    cutoff = pd.Timestamp("2024-02-01 03:00:00.0000015", tz="UTC")
+    result = _filter_with_cutoff(parsed_df, cutoff)
+
+    assert result["value"].tolist() == [1.0]
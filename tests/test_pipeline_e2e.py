@@ -286,6 +286,35 @@ def test_pipeline_e2e_no_changes_skips(
         assert current_manifest["current_version"] == run1.version_ts
 
 
+@patch("ingestor_reader.use_cases.run_pipeline.step_fetch_resource")
+@patch("ingestor_reader.use_cases.run_pipeline.step_parse_file")
+@patch("ingestor_reader.use_cases.run_pipeline.step_normalize_rows")
+def test_pipeline_e2e_unchanged_source_reuses_fetch_hash(
+    mock_step_normalize_rows,
+    mock_step_parse_file,
+    mock_step_fetch_resource,
+    app_config,
+    dataset_config,
+    sample_data,
+    aws_resources,
+):
+    """Test that the source change check uses the hash computed by the fetch step."""
+    from ingestor_reader.use_cases.steps.fetch_resource import compute_file_hash
+    content = b"fake_excel_content"
+    mock_step_fetch_resource.return_value = (content, compute_file_hash(content), len(content))
+    mock_step_parse_file.return_value = sample_data
+    mock_step_normalize_rows.return_value = sample_data
+    
+    run_pipeline(dataset_config, app_config, run_id="test-run-1")
+    mock_step_parse_file.reset_mock()
+    
+    with patch("ingestor_reader.use_cases.steps.check_source_changed.compute_file_hash") as mock_hash:
+        run_pipeline(dataset_config, app_config, run_id="test-run-2")
+    
+    mock_hash.assert_not_called()
+    mock_step_parse_file.assert_not_called()
+
+
 @patch("ingestor_reader.use_cases.run_pipeline.step_fetch_resource")
 @patch("ingestor_reader.use_cases.run_pipeline.step_parse_file")
 @patch("ingestor_reader.use_cases.run_pipeline.step_normalize_rows")
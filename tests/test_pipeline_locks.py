@@ -1,5 +1,6 @@
 """Tests for pipeline locks."""
 import pytest
+from concurrent.futures import Future
 from unittest.mock import Mock, MagicMock, patch
 from moto import mock_aws
 import boto3
@@ -119,6 +120,9 @@ def test_pipeline_with_lock_acquires_and_releases(
     # Verify pipeline executed
     mock_fetch.assert_called_once()
     mock_publish.assert_called_once()
+    
+    # Index read was prefetched and handed to the delta step
+    assert isinstance(mock_compute_delta.call_args[0][3], Future)
 
 
 @patch("ingestor_reader.use_cases.run_pipeline.step_fetch_resource")
@@ -169,6 +173,33 @@ def test_pipeline_without_lock_executes(
     mock_check_source.assert_called_once()
 
 
+@patch("ingestor_reader.use_cases.run_pipeline.S3Catalog.read_index")
+@patch("ingestor_reader.use_cases.run_pipeline.step_fetch_resource")
+@patch("ingestor_reader.use_cases.run_pipeline.step_check_source_changed")
+@patch("ingestor_reader.use_cases.run_pipeline.step_parse_file")
+@patch("ingestor_reader.use_cases.run_pipeline.step_filter_new_data")
+def test_pipeline_skips_index_read_without_new_data(
+    mock_filter,
+    mock_parse,
+    mock_check_source,
+    mock_fetch,
+    mock_read_index,
+    app_config_without_lock,
+    dataset_config,
+    aws_resources,
+):
+    """Test that the index isn't downloaded when the filter leaves no rows."""
+    mock_fetch.return_value = (b"content", "hash123", 100)
+    mock_check_source.return_value = True
+    mock_parse.return_value = pd.DataFrame({"col1": [1, 2, 3]})
+    mock_filter.return_value = pd.DataFrame({"col1": []})
+    
+    run_pipeline(dataset_config, app_config_without_lock, run_id="run-123")
+    
+    mock_filter.assert_called_once()
+    mock_read_index.assert_not_called()
+
+
 @patch("ingestor_reader.use_cases.run_pipeline.step_fetch_resource")
 @patch("ingestor_reader.use_cases.run_pipeline.step_check_source_changed")
 def test_pipeline_releases_lock_on_error(
@@ -146,6 +146,52 @@ def test_rebuild_index_from_pointer_reconstructs_index(catalog):
     # Index only contains key_hash, not version
 
 
+def test_rebuild_index_from_pointer_deduplicates_across_versions(catalog):
+    """Test that keys repeated across versions appear once in the rebuilt index."""
+    dataset_id = "test_dataset"
+    old_version = "2024-01-01T00-00-00"
+    current_version = "2024-02-01T00-00-00"
+    
+    catalog.put_current_manifest_pointer(
+        dataset_id, {"dataset_id": dataset_id, "current_version": current_version}, None
+    )
+    manifest = Manifest(
+        dataset_id=dataset_id,
+        version=current_version,
+        created_at=datetime.now(timezone.utc).isoformat(),
+        source={"files": []},
+        outputs=OutputsInfo(
+            data_prefix=f"datasets/{dataset_id}/events/{current_version}/data/",
+            files=[],
+            rows_total=3,
+            rows_added_this_version=2,
+        ),
+        index=IndexInfo(
+            path=f"datasets/{dataset_id}/index/keys.parquet",
+            key_columns=["series_code"],
+            hash_column="key_hash",
+        ),
+    )
+    catalog.write_event_manifest(dataset_id, current_version, manifest)
+    
+    catalog.write_events(dataset_id, old_version, pd.DataFrame({
+        "series_code": ["A", "B"],
+        "obs_time": pd.to_datetime(["2024-01-15", "2024-01-16"]),
+        "value": [1, 2]
+    }))
+    catalog.write_events(dataset_id, current_version, pd.DataFrame({
+        "series_code": ["B", "C"],
+        "obs_time": pd.to_datetime(["2024-01-16", "2024-01-17"]),
+        "value": [2, 3]
+    }))
+    
+    catalog.rebuild_index_from_pointer(dataset_id)
+    
+    index_df = catalog.read_index(dataset_id)
+    assert len(index_df) == 3
+    assert index_df["key_hash"].is_unique
+
+
 def test_publish_version_handles_index_write_failure_gracefully(catalog):
     """Test that publish_version handles index write failure after CAS."""
     dataset_id = "test_dataset"
@@ -193,3 +239,84 @@ def test_publish_version_handles_index_write_failure_gracefully(catalog):
     index_df = catalog.read_index(dataset_id)
     assert index_df is None  # Index doesn't exist or wasn't updated
 
+
+
+def test_publish_version_records_max_date(catalog):
+    """Test that the event manifest records the latest date of the published rows."""
+    dataset_id = "test_dataset"
+    version_ts = "2024-01-01T00-00-00"
+    delta_df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-31 23:30", "2024-01-15 00:00"]).tz_localize("UTC"),
+        "key_hash": ["hash1", "hash2"],
+    })
+
+    published = publish_version(
+        catalog=catalog,
+        dataset_id=dataset_id,
+        version_ts=version_ts,
+        source_file=SourceFile(sha256="hash123", size=1000),
+        output_keys=["events/2024-01-01T00-00-00/data/part-0.parquet"],
+        rows_added=2,
+        primary_keys=["obs_time"],
+        current_index_df=None,
+        delta_df=delta_df,
+        current_manifest_etag=None,
+    )
+
+    assert published
+    manifest = catalog.read_event_manifest(dataset_id, version_ts)
+    assert pd.Timestamp(manifest["outputs"]["max_date"]) == pd.Timestamp("2024-01-31 23:30", tz="UTC")
+
+
+def test_put_current_manifest_pointer_rejects_stale_etag(catalog):
+    """Test that the pointer CAS is enforced server-side via If-Match."""
+    dataset_id = "test_dataset"
+    
+    etag_v1 = catalog.put_current_manifest_pointer(
+        dataset_id, {"dataset_id": dataset_id, "current_version": "v1"}, None
+    )
+    etag_v2 = catalog.put_current_manifest_pointer(
+        dataset_id, {"dataset_id": dataset_id, "current_version": "v2"}, etag_v1
+    )
+    assert etag_v2 != etag_v1
+    
+    # Writing with the stale ETag must fail and leave the pointer untouched
+    with pytest.raises(ValueError, match="Conditional PUT failed"):
+        catalog.put_current_manifest_pointer(
+            dataset_id, {"dataset_id": dataset_id, "current_version": "v3"}, etag_v1
+        )
+    
+    current_pointer = catalog.read_current_manifest(dataset_id)
+    assert current_pointer["current_version"] == "v2"
+
+
+def test_index_row_count_read_from_metadata(catalog):
+    """Test that the index row count comes from object metadata, not a full GET."""
+    dataset_id = "test_dataset"
+    catalog.write_index(dataset_id, pd.DataFrame({"key_hash": ["hash1", "hash2"]}))
+    
+    with patch.object(catalog.s3, "get_object", side_effect=AssertionError("unexpected GET")):
+        assert catalog._index_store.read_index_row_count(dataset_id) == 2
+    
+    assert catalog._index_store.read_index_row_count("missing_dataset") is None
+
+
+def test_memoized_index_downloaded_once(aws_resources):
+    """Test that a memoizing catalog reuses the index instead of re-downloading it."""
+    catalog = S3Catalog(S3Storage(bucket="test-bucket", region="us-east-1"), memoize_index=True)
+    dataset_id = "test_dataset"
+    index_df = pd.DataFrame({"key_hash": ["hash1", "hash2"]})
+    S3Catalog(catalog.s3).write_index(dataset_id, index_df)
+    
+    with patch.object(catalog.s3, "get_object", wraps=catalog.s3.get_object) as mock_get:
+        first = catalog.read_index(dataset_id)
+        second = catalog.read_index(dataset_id)
+        assert catalog._index_store.read_index_row_count(dataset_id) == 2
+    
+    assert mock_get.call_count == 1
+    assert second is first
+    
+    # A write replaces the memoized copy
+    updated_df = pd.DataFrame({"key_hash": ["hash1", "hash2", "hash3"]})
+    catalog.write_index(dataset_id, updated_df)
+    assert catalog.read_index(dataset_id) is updated_df
@@ -0,0 +1,43 @@
+"""Tests for the read_latest_dataset script."""
+import importlib.util
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+_SCRIPT = Path(__file__).parent.parent / "scripts" / "read_latest_dataset.py"
+_spec = importlib.util.spec_from_file_location("read_latest_dataset", _SCRIPT)
+read_latest_dataset = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(read_latest_dataset)
+
+
+def test_write_tables_streams_series_to_parquet(tmp_path):
+    """Test that series with the same schema are all written to the Parquet file."""
+    output_file = str(tmp_path / "out.parquet")
+    tables = [
+        pa.table({"internal_series_code": ["A"], "value": [1.0]}),
+        pa.table({"internal_series_code": ["B", "B"], "value": [2.0, 3.0]}),
+    ]
+
+    rows = read_latest_dataset._write_tables(iter(tables), output_file)
+
+    assert rows == 3
+    assert pq.read_table(output_file).column("value").to_pylist() == [1.0, 2.0, 3.0]
+
+
+def test_write_tables_promotes_wider_schema_from_later_series(tmp_path):
+    """Test that a column all-None in the first series and string in a later one is kept."""
+    output_file = str(tmp_path / "out.parquet")
+    tables = [
+        pa.table({"value": [1.0], "unit": pa.array([None], type=pa.null())}),
+        pa.table({"value": [2.0], "unit": ["ARS"]}),
+        pa.table({"value": [3.0], "unit": ["USD"]}),
+    ]
+
+    rows = read_latest_dataset._write_tables(iter(tables), output_file)
+
+    result = pq.read_table(output_file)
+    assert rows == 3
+    assert result.schema.field("unit").type == pa.string()
+    assert result.column("unit").to_pylist() == [None, "ARS", "USD"]
+    assert result.column("value").to_pylist() == [1.0, 2.0, 3.0]
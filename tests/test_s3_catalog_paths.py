@@ -55,20 +55,53 @@ def test_read_current_manifest():
     """Test reading current manifest."""
     s3_storage = Mock(spec=S3Storage)
     manifest_data = {"dataset_id": "TEST", "current_version": "v1"}
-    s3_storage.get_object = Mock(return_value=json.dumps(manifest_data).encode())
+    s3_storage.get_object_conditional = Mock(
+        return_value=(json.dumps(manifest_data).encode(), "etag1")
+    )
     catalog = S3Catalog(s3_storage)
     
     manifest = catalog.read_current_manifest("TEST")
     assert manifest == manifest_data
     
+    # Test cached read (304 Not Modified)
+    s3_storage.get_object_conditional = Mock(return_value=(None, "etag1"))
+    manifest = catalog.read_current_manifest("TEST")
+    assert manifest == manifest_data
+    assert s3_storage.get_object_conditional.call_args[1]["if_none_match"] == "etag1"
+    
     # Test None case
     from botocore.exceptions import ClientError
     error = ClientError({"Error": {"Code": "404"}}, "GetObject")
-    s3_storage.get_object = Mock(side_effect=error)
+    s3_storage.get_object_conditional = Mock(side_effect=error)
     manifest = catalog.read_current_manifest("TEST")
     assert manifest is None
 
 
+def test_read_current_manifest_memoized():
+    """Test that a memoizing catalog fetches each manifest once per run."""
+    s3_storage = Mock(spec=S3Storage)
+    manifest_data = {"dataset_id": "TEST", "current_version": "v1"}
+    s3_storage.get_object_conditional = Mock(
+        return_value=(json.dumps(manifest_data).encode(), "etag1")
+    )
+    s3_storage.put_object = Mock(return_value="etag2")
+    catalog = S3Catalog(s3_storage, memoize_manifests=True)
+    
+    assert catalog.read_current_manifest("TEST") == manifest_data
+    assert catalog.read_current_manifest("TEST") == manifest_data
+    assert catalog.get_current_manifest_etag("TEST") == "etag1"
+    s3_storage.get_object_conditional.assert_called_once()
+    s3_storage.head_object.assert_not_called()
+    
+    # Overwriting the pointer memoizes the new body and ETag
+    new_data = {"dataset_id": "TEST", "current_version": "v2"}
+    catalog.put_current_manifest_pointer("TEST", new_data, "etag1")
+    assert catalog.read_current_manifest("TEST") == new_data
+    assert catalog.get_current_manifest_etag("TEST") == "etag2"
+    s3_storage.get_object_conditional.assert_called_once()
+    s3_storage.head_object.assert_not_called()
+
+
 def test_put_current_manifest_pointer_cas():
     """Test CAS pointer update."""
     s3_storage = Mock(spec=S3Storage)
@@ -83,10 +116,13 @@ def test_put_current_manifest_pointer_cas():
     call_args = s3_storage.put_object.call_args
     assert call_args[1]["if_match"] == "old-etag"
     
-    # Test CAS failure
+    # Test CAS failure (S3Storage turns the 412 into a ValueError)
     from botocore.exceptions import ClientError
     error = ClientError({"Error": {"Code": "412"}}, "PutObject")
-    s3_storage.put_object = Mock(side_effect=error)
+    s3_storage = S3Storage("test-bucket")
+    s3_storage.s3_client = Mock()
+    s3_storage.s3_client.put_object.side_effect = error
+    catalog = S3Catalog(s3_storage)
     
     with pytest.raises(ValueError, match="Conditional PUT failed"):
         catalog.put_current_manifest_pointer("TEST", body, "old-etag")
@@ -130,12 +166,12 @@ def test_read_write_index():
     # Mock parquet IO on the internal store
     df = pd.DataFrame({"key_hash": ["hash1", "hash2"]})
     catalog._index_store.parquet_io = Mock()
-    catalog._index_store.parquet_io.write_to_bytes = Mock(return_value=b"parquet-data")
+    catalog._index_store.parquet_io.write_to_buffer = Mock(return_value=b"parquet-data")
     catalog._index_store.parquet_io.read_from_bytes = Mock(return_value=df)
     
     # Test write
     catalog.write_index("TEST", df)
-    s3_storage.put_object.assert_called_once()
+    s3_storage.put_object_stream.assert_called_once()
     
     # Test read
     s3_storage.get_object = Mock(return_value=b"parquet-data")
@@ -158,12 +194,12 @@ def test_write_events():
     
     df = pd.DataFrame({"col1": [1, 2, 3]})
     catalog._event_store.parquet_io = Mock()
-    catalog._event_store.parquet_io.write_to_bytes = Mock(return_value=b"parquet-data")
+    catalog._event_store.parquet_io.write_to_buffer = Mock(return_value=b"parquet-data")
     
     keys = catalog.write_events("TEST", "v1", df)
     
     assert len(keys) == 1
     assert "events" in keys[0]
     assert "v1" in keys[0]
-    s3_storage.put_object.assert_called_once()
+    s3_storage.put_object_stream.assert_called_once()
 
@@ -6,8 +6,18 @@ import boto3
 import pandas as pd
 from botocore.exceptions import ClientError
 
+from ingestor_reader.domain.entities.dataset_config import (
+    DatasetConfig,
+    SourceConfig,
+    ParseConfig,
+    NormalizeConfig,
+    OutputConfig,
+)
+from ingestor_reader.infra.parquet_io import ParquetIO
 from ingestor_reader.infra.s3_catalog import S3Catalog
 from ingestor_reader.infra.s3_storage import S3Storage
+from ingestor_reader.use_cases.steps.enrich_metadata import enrich_metadata
+from ingestor_reader.use_cases.steps.write_events import write_events
 
 
 @pytest.fixture
@@ -144,3 +154,76 @@ def test_write_events_verifies_all_events_before_index_update(catalog):
     assert index_updated[0] is True
     assert len(event_keys) == 3
 
+
+
+def test_put_object_stream_multipart_for_large_buffers(catalog):
+    """Test that buffers above the multipart threshold are uploaded via upload_fileobj."""
+    import pyarrow as pa
+    from ingestor_reader.infra.s3_storage import MULTIPART_THRESHOLD
+    
+    body = b"x" * (MULTIPART_THRESHOLD + 1)
+    catalog.s3.put_object_stream("large.bin", pa.py_buffer(body), content_type="application/x-parquet")
+    
+    assert catalog.s3.get_object("large.bin") == body
+    assert catalog.s3.head_object("large.bin")["ContentLength"] == len(body)
+
+
+def test_put_object_multipart_for_large_bodies(catalog):
+    """Test that large unconditional bytes bodies use a multipart upload."""
+    from ingestor_reader.infra.s3_storage import MULTIPART_THRESHOLD
+    
+    body = b"x" * (MULTIPART_THRESHOLD + 1)
+    with patch.object(
+        catalog.s3.s3_client, "upload_fileobj", wraps=catalog.s3.s3_client.upload_fileobj
+    ) as mock_upload:
+        etag = catalog.s3.put_object("large.bin", body, content_type="application/octet-stream")
+    
+    mock_upload.assert_called_once()
+    assert etag == catalog.s3.head_object("large.bin")["ETag"]
+    assert catalog.s3.get_object("large.bin") == body
+
+
+def test_rollback_events_deletes_in_batches(catalog):
+    """Test that rollback deletes all keys using batched DeleteObjects calls."""
+    keys = [f"datasets/test_dataset/events/v1/data/part-{i}.parquet" for i in range(5)]
+    for key in keys:
+        catalog.s3.put_object(key, b"data")
+    
+    delete_calls = []
+    original_delete = catalog.s3.s3_client.delete_objects
+    
+    def tracking_delete(**kwargs):
+        delete_calls.append(len(kwargs["Delete"]["Objects"]))
+        return original_delete(**kwargs)
+    
+    catalog.s3.s3_client.delete_objects = tracking_delete
+    
+    with patch("ingestor_reader.infra.s3_storage.DELETE_BATCH_SIZE", 2):
+        catalog._rollback_events(keys)
+    
+    assert sorted(delete_calls) == [1, 2, 2]
+    assert catalog.s3.list_objects("datasets/test_dataset/events/") == []
+
+
+def test_write_events_step_writes_constants_as_strings(catalog):
+    """Test that enriched constants are written as strings, not categories."""
+    config = DatasetConfig(
+        dataset_id="test_dataset",
+        frequency="daily",
+        source=SourceConfig(kind="http", url="http://example.com/data.xlsx", format="xlsx"),
+        parse=ParseConfig(plugin="test_parser"),
+        normalize=NormalizeConfig(plugin="test_normalizer", primary_keys=["obs_time", "internal_series_code"]),
+        output=OutputConfig(),
+    )
+    df = pd.DataFrame({
+        "obs_time": pd.to_datetime(["2024-01-15", "2024-01-16"]),
+        "value": [1.0, 2.0],
+        "internal_series_code": ["SERIES_1", "SERIES_2"],
+    })
+    enriched = enrich_metadata(df, config, "2024-01-01T00-00-00")
+
+    event_keys, _ = write_events(catalog, config, "2024-01-01T00-00-00", enriched)
+
+    events = ParquetIO().read_from_bytes(catalog.s3.get_object(event_keys[0]))
+    for column in ["dataset_id", "frequency", "source_kind", "version", "quality_flag"]:
+        assert events[column].dtype == events["internal_series_code"].dtype, column